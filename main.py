@@ -13,21 +13,26 @@ Memecoin Detection Bot with Integrated Twitter Scraper
 
 from __future__ import annotations
 
-import os, sys, re, json, time, asyncio, logging, pathlib
+import os, sys, re, time, random, asyncio, logging, pathlib, heapq, mmap
+from array import array
 from datetime import timedelta, datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
-from collections import defaultdict
-
-import requests
-import pandas as pd
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from collections import defaultdict, OrderedDict
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlparse
+
+import aiohttp
+import orjson
 from bs4 import BeautifulSoup
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.error import BadRequest
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.error import BadRequest, RetryAfter
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes
 
 # ========== BUY BOT INTEGRATION ==========
 try:
@@ -97,13 +102,19 @@ MIN_LIQ_USD     = float(os.getenv("MIN_LIQ_USD",     "35000"))
 MIN_MCAP_USD    = float(os.getenv("MIN_MCAP_USD",    "70000"))
 MIN_VOL_H24_USD = float(os.getenv("MIN_VOL_H24_USD", "40000"))
 MAX_AGE_MIN     = float(os.getenv("MAX_AGE_MIN",     "120"))
+# FIRST_SEEN entries older than this are dropped; by then the pair is far past MAX_AGE_MIN so it can't re-alert
+FIRST_SEEN_RETENTION_MIN = float(os.getenv("FIRST_SEEN_RETENTION_MIN", str(MAX_AGE_MIN * 10)))
 CHAIN_ID        = os.getenv("CHAIN_ID", "solana").lower()
 
 # Twitter Scraper Config
 TWITTER_SCRAPER_ENABLED = os.getenv("TWITTER_SCRAPER_ENABLED", "1") == "1"
 TWITTER_SCRAPE_TIMEOUT = int(os.getenv("TWITTER_SCRAPE_TIMEOUT", "60"))
 TWITTER_MAX_USERNAMES = int(os.getenv("TWITTER_MAX_USERNAMES", "200"))
+TWITTER_MAX_PAGE_BYTES = int(os.getenv("TWITTER_MAX_PAGE_BYTES", str(2 * 1024 * 1024)))  # reader pages are cut off here
+TWITTER_VARIANT_CONCURRENCY = max(1, int(os.getenv("TWITTER_VARIANT_CONCURRENCY", "3")))  # URL variants fetched at once per scrape
 TWITTER_CACHE_JSON = os.getenv("TWITTER_CACHE_JSON", "/tmp/telegram-bot/twitter_cache.json")
+TWITTER_CACHE_TTL_SEC = int(os.getenv("TWITTER_CACHE_TTL_SEC", "3600"))
+TWITTER_CACHE_MAX = int(os.getenv("TWITTER_CACHE_MAX", "4096"))
 
 AXIOM_WEB_URL = os.getenv("AXIOM_WEB_URL") or os.getenv("AXIOME_WEB_URL") or "https://axiom.trade/meme/{pair}"
 GMGN_WEB_URL  = os.getenv("GMGN_WEB_URL", "https://gmgn.ai/sol/token/{mint}")
@@ -113,6 +124,9 @@ X_USER_URL             = os.getenv("X_USER_URL", "https://x.com/{handle}")
 
 TOP_N_PER_TICK = int(os.getenv("TOP_N_PER_TICK", "0"))
 NO_MATCH_PING  = int(os.getenv("NO_MATCH_PING", "0"))
+SEND_CONCURRENCY = int(os.getenv("SEND_CONCURRENCY", "20"))
+TG_SEND_RPS      = float(os.getenv("TG_SEND_RPS", "25"))   # global Bot API calls/s (Telegram caps ~30)
+TG_SEND_RETRIES  = int(os.getenv("TG_SEND_RETRIES", "2"))  # retries after a 429 RetryAfter pause
 
 def _p(env_name: str, default_path: str) -> str:
     return os.getenv(env_name, default_path)
@@ -131,9 +145,36 @@ for d in [pathlib.Path(SUBS_FILE).parent, pathlib.Path(FIRST_SEEN_FILE).parent,
 
 TW_BEARER = os.getenv("TW_BEARER", "").strip()
 
-SESSION = requests.Session()
-SESSION.headers.update({"User-Agent": f"tg-memebot/trade-{TRADE_SUMMARY_SEC}s", "Accept": "*/*"})
 HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "20"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))  # a hung TCP/TLS handshake fails fast
+TG_HTTP_VERSION = os.getenv("TG_HTTP_VERSION", "2")  # Bot API transport; "1.1" to disable HTTP/2
+DEX_RPS      = float(os.getenv("DEX_RPS", "5"))
+DEX_CONCURRENCY = int(os.getenv("DEX_CONCURRENCY", "32"))
+DEX_CACHE_TTL_SEC = float(os.getenv("DEX_CACHE_TTL_SEC", "5"))
+DEX_NEG_TTL_SEC   = float(os.getenv("DEX_NEG_TTL_SEC", "2"))  # failed URLs return None this long without refetching
+
+# Shared async client (Dexscreener, reader services, logos): one connector so TCP/TLS sessions and DNS lookups are reused
+_HTTP: Optional[aiohttp.ClientSession] = None
+
+def _http() -> aiohttp.ClientSession:
+    global _HTTP
+    if _HTTP is None or _HTTP.closed:
+        # Per-host cap follows DEX_CONCURRENCY so _DEX_SEM, not the pool, bounds parallel Dexscreener calls;
+        # idle connections live 60s (default 15s) so they survive the gaps between job ticks
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=max(10, DEX_CONCURRENCY), ttl_dns_cache=300,
+                                         keepalive_timeout=60, enable_cleanup_closed=True)
+        _HTTP = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": f"tg-memebot/trade-{TRADE_SUMMARY_SEC}s", "Accept": "*/*", "Accept-Encoding": "gzip, deflate"},
+            trust_env=True,
+        )
+    return _HTTP
+
+async def _close_http() -> None:
+    global _HTTP
+    if _HTTP is not None and not _HTTP.closed:
+        await _HTTP.close()
+    _HTTP = None
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -150,21 +191,93 @@ READER_SERVICES = [
 # Global set to keep task references (prevent garbage collection)
 BACKGROUND_TASKS: Set[asyncio.Task] = set()
 
+# Caps concurrent Telegram sends during subscriber fan-out
+_SEND_SEM = asyncio.Semaphore(SEND_CONCURRENCY)
+
+# -----------------------------------------------------------------------------
+# Append-only JSONL stores
+# -----------------------------------------------------------------------------
+# A store file is a log of {"k": key, "v": value} upserts and {"k": key, "d": 1} deletes, one per line.
+# Saves append only the changed keys; the owner compacts it (atomic replace) once the log is more
+# than twice the live size. Files still holding a legacy whole-JSON object load as a snapshot.
+def _jsonl_load(path) -> Tuple[Dict[Any, Any], int]:
+    """Replay a store into a dict; returns (data, records in file). List keys come back as tuples."""
+    p = pathlib.Path(path)
+    if not p.exists() or p.stat().st_size == 0: return {}, 0
+    # mmap instead of read_bytes(): the file is parsed in place and replayed a line at a time,
+    # never held as one bytes object plus a list of line copies
+    with open(p, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        try:
+            with memoryview(mm) as view: obj = orjson.loads(view)
+            if isinstance(obj, dict) and "k" not in obj: return obj, len(obj)
+        except orjson.JSONDecodeError:
+            pass
+        out: Dict[Any, Any] = {}; n = 0
+        for line in iter(mm.readline, b""):
+            if not line.strip(): continue
+            try: rec = orjson.loads(line)
+            except orjson.JSONDecodeError: continue  # torn tail from an interrupted append
+            k = rec.get("k")
+            if isinstance(k, list): k = tuple(k)
+            if rec.get("d"): out.pop(k, None)
+            else: out[k] = rec.get("v")
+            n += 1
+    return out, n
+
+def _jsonl_append(path, items: List[Tuple[Any, Any]]) -> int:
+    """Append (key, value) records; a value of None records a delete. Returns records written."""
+    if not items: return 0
+    # Leading newline keeps a record intact even if the previous append was torn mid-line
+    data = b"".join(b"\n" + orjson.dumps({"k": k, "d": 1} if v is None else {"k": k, "v": v}) for k, v in items)
+    p = pathlib.Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with open(p, "ab") as f:
+        f.write(data)
+    return len(items)
+
+def _jsonl_compact(path, d: Dict[Any, Any]) -> None:
+    # list(d.items()) is taken in one step, so this is safe from a worker thread while the loop mutates d
+    items = list(d.items())
+    p = pathlib.Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_bytes(b"".join(b"\n" + orjson.dumps({"k": k, "v": v}) for k, v in items))
+    os.replace(tmp, p)
+
 # ====================================================================================
 # TWITTER SCRAPER CLASSES
 # ====================================================================================
 
+# Compiled once at import; these run over every scraped page and every cache key
+# BROAD patterns to catch all usernames (from functioning version). Kept as separate passes:
+# a single alternation only finds leftmost non-overlapping matches and drops names the passes catch.
+# Byte patterns run on the raw response body (no decode); case is spelled out instead of re.I and
+# \xc2\xa0 (nbsp) counts as whitespace (other non-ASCII spaces don't). The @name end check is ASCII-only
+# here; _word_char_at finishes the str \b check by decoding the one code point after a match.
+_SP = rb'(?:\s|\xc2\xa0)'
+_AT_USERNAME_RE = re.compile(rb'@([A-Za-z0-9_]{1,15})(?![A-Za-z0-9_])')
+_USERNAME_PATTERNS = (
+    _AT_USERNAME_RE,
+    re.compile(rb'(?:[Tt][Ww][Ii][Tt][Tt][Ee][Rr]|[Xx])\.[Cc][Oo][Mm]/([A-Za-z0-9_]{1,15})(?:/|$|\?)'),
+    re.compile(rb'\(@([A-Za-z0-9_]+)\)' + _SP + rb'+[Oo][Nn]' + _SP + rb'+(?:[Xx]|[Tt][Ww][Ii][Tt][Tt][Ee][Rr])'),
+    re.compile(rb'[Pp][Oo][Ss][Tt][Ee][Dd]' + _SP + rb'+[Bb][Yy]' + _SP + rb'+@?([A-Za-z0-9_]+)'),
+    re.compile(rb'^@?([A-Za-z0-9_]+)' + _SP + rb'*[:\-]', re.M),
+)
+_TW_HANDLE_RE    = re.compile(r'[A-Za-z0-9_]{1,15}')  # used with fullmatch
+
+def _word_char_at(data: bytes, i: int) -> bool:
+    """True if a non-ASCII letter/digit starts at data[i] (str \\w beyond ASCII, e.g. é or ² but not 。 or ×)"""
+    if i >= len(data) or data[i] < 0x80: return False
+    n = 2 if data[i] < 0xe0 else 3 if data[i] < 0xf0 else 4
+    return data[i:i+n].decode("utf-8", "replace")[:1].isalnum()
+_TW_URL_RE       = re.compile(r'(?:twitter|x)\.com/([A-Za-z0-9_]+)', re.I)
+_COMMUNITIES_RE  = re.compile(r'/i/communities/(\d+)')
+_LISTS_RE        = re.compile(r'/i/lists/(\d+)')
+
 class TwitterPatternMatcher:
+    username_patterns = _USERNAME_PATTERNS
+    
     def __init__(self):
-        # BROAD patterns to catch all usernames (from functioning version)
-        self.username_patterns = [
-            re.compile(r'@([A-Za-z0-9_]{1,15})\b'),
-            re.compile(r'(?:twitter|x)\.com/([A-Za-z0-9_]{1,15})(?:/|$|\?)', re.I),
-            re.compile(r'\(@([A-Za-z0-9_]+)\)\s+on\s+(?:X|Twitter)', re.I),
-            re.compile(r'Posted\s+by\s+@?([A-Za-z0-9_]+)', re.I),
-            re.compile(r'^@?([A-Za-z0-9_]+)\s*[:\-]', re.M),
-        ]
-        
         # Hard-coded generic/system blacklist
         self.blacklist = {
             # Generic terms
@@ -188,16 +301,17 @@ class TwitterPatternMatcher:
             'ca', 'conversation',
         }
     
-    def extract_usernames(self, text: str) -> Set[str]:
-        """Extract valid Twitter usernames from text - applies BOTH blacklists"""
+    def extract_usernames(self, data: bytes) -> Set[str]:
+        """Extract valid Twitter usernames from raw page bytes - applies BOTH blacklists"""
         usernames = set()
         
         # Combine hard-coded blacklist with user's dynamic blacklist
         combined_blacklist = self.blacklist | TWITTER_BLACKLIST
         
         for pattern in self.username_patterns:
-            for match in pattern.finditer(text):
-                username = match.group(1).lower()
+            for match in pattern.finditer(data):
+                if pattern is _AT_USERNAME_RE and _word_char_at(data, match.end()): continue
+                username = match.group(1).decode("ascii").lower()
                 if (username not in combined_blacklist and  # ← Now checks BOTH!
                     len(username) <= 15 and 
                     len(username) >= 1 and 
@@ -214,7 +328,7 @@ class URLVariantGenerator:
         elif '/i/lists/' in url:
             return 'list'
         path_parts = [p for p in url.split('/') if p and p not in ['https:', 'http:', '', 'x.com', 'twitter.com']]
-        if path_parts and re.match(r'^[A-Za-z0-9_]{1,15}$', path_parts[0]):
+        if path_parts and _TW_HANDLE_RE.fullmatch(path_parts[0]):
             return 'profile'
         return 'unknown'
     
@@ -224,7 +338,7 @@ class URLVariantGenerator:
         variants = []
         
         if url_type == 'community':
-            match = re.search(r'/i/communities/(\d+)', url)
+            match = _COMMUNITIES_RE.search(url)
             if match:
                 cid = match.group(1)
                 variants = [
@@ -233,7 +347,7 @@ class URLVariantGenerator:
                     f"https://twitter.com/i/communities/{cid}",
                 ]
         elif url_type == 'profile':
-            match = re.search(r'(?:x|twitter)\.com/([A-Za-z0-9_]+)', url, re.I)
+            match = _TW_URL_RE.search(url)
             if match:
                 username = match.group(1)
                 if username not in ['i', 'home', 'explore', 'search']:
@@ -243,7 +357,7 @@ class URLVariantGenerator:
                         f"https://twitter.com/{username}",
                     ]
         elif url_type == 'list':
-            match = re.search(r'/i/lists/(\d+)', url)
+            match = _LISTS_RE.search(url)
             if match:
                 lid = match.group(1)
                 variants = [f"https://x.com/i/lists/{lid}", f"https://twitter.com/i/lists/{lid}"]
@@ -251,62 +365,88 @@ class URLVariantGenerator:
         if url not in variants:
             variants.insert(0, url)
         
-        seen = set()
-        unique = []
-        for v in variants:
-            if v not in seen:
-                seen.add(v)
-                unique.append(v)
-        return unique[:8]
+        return list(dict.fromkeys(variants))[:8]  # ordered dedup
 
 class TwitterScraper:
     def __init__(self):
+        self._log_len = 0  # records currently in TWITTER_CACHE_JSON
         self.cache = self._load_cache()
         self.matcher = TwitterPatternMatcher()
         self.url_generator = URLVariantGenerator()
         self.successful_service = None
+        self._inflight: Dict[str, asyncio.Task] = {}  # cache key -> scrape in progress
+        self._io_lock = asyncio.Lock()  # one cache-file writer at a time (appends vs compaction)
     
-    def _load_cache(self) -> Dict:
-        p = pathlib.Path(TWITTER_CACHE_JSON)
-        if p.exists():
-            try:
-                data = json.loads(p.read_text())
-                log.info(f"[Twitter] Loaded cache: {len(data)} entries")
-                return data
-            except:
-                return {}
-        return {}
-    
-    def _save_cache(self):
+    def _load_cache(self) -> "OrderedDict[str, Dict]":
+        try:
+            raw, self._log_len = _jsonl_load(TWITTER_CACHE_JSON)
+            # Oldest first, so the LRU order survives restarts
+            data = OrderedDict(sorted(raw.items(), key=lambda kv: kv[1].get('timestamp', 0) if isinstance(kv[1], dict) else 0))
+            if data: log.info(f"[Twitter] Loaded cache: {len(data)} entries")
+            return data
+        except Exception:
+            return OrderedDict()
+    
+    def _save_cache(self, entries: Optional[Dict[str, Any]] = None):
+        """Compact the cache file into a snapshot of `entries` (default: the current cache)"""
+        if entries is None: entries = self.cache
         try:
-            pathlib.Path(TWITTER_CACHE_JSON).write_text(json.dumps(self.cache, indent=2))
+            _jsonl_compact(TWITTER_CACHE_JSON, entries)
+            self._log_len = len(entries)
         except Exception as e:
             log.error(f"[Twitter] Cache save failed: {e}")
     
+    def _append_cache(self, items: List[Tuple[str, Any]]) -> None:
+        try:
+            self._log_len += _jsonl_append(TWITTER_CACHE_JSON, items)
+        except Exception as e:
+            log.error(f"[Twitter] Cache append failed: {e}")
+    
+    async def persist_cache(self, changes: Optional[List[Tuple[str, Any]]] = None) -> None:
+        """Write cache changes off the event loop; None (or an overgrown log) compacts from a snapshot"""
+        async with self._io_lock:
+            if changes is None or self._log_len + len(changes) > max(64, 2 * len(self.cache)):
+                await asyncio.to_thread(self._save_cache, dict(self.cache))
+            else:
+                await asyncio.to_thread(self._append_cache, changes)
+    
     def _get_cache_key(self, url: str) -> str:
         url = url.lower()
         if '/i/communities/' in url:
-            match = re.search(r'/i/communities/(\d+)', url)
+            match = _COMMUNITIES_RE.search(url)
             if match:
                 return f"community_{match.group(1)}"
-        match = re.search(r'(?:twitter|x)\.com/([A-Za-z0-9_]+)', url, re.I)
+        match = _TW_URL_RE.search(url)
         if match:
             return f"profile_{match.group(1).lower()}"
         return url
     
     def get_cached_usernames(self, url: str) -> Optional[Set[str]]:
         cache_key = self._get_cache_key(url)
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            if isinstance(cached, dict):
-                age = time.time() - cached.get('timestamp', 0)
-                if age < 3600:
-                    usernames = set(cached.get('usernames', []))
-                    log.info(f"[Twitter] Cache HIT: {cache_key} ({int(age)}s)")
-                    return usernames
-        return None
-    
-    def _try_service(self, url: str, service: Dict, timeout: int = None) -> Optional[str]:
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        age = time.time() - cached.get('timestamp', 0) if isinstance(cached, dict) else 1e18
+        if age >= TWITTER_CACHE_TTL_SEC:
+            del self.cache[cache_key]
+            return None
+        self.cache.move_to_end(cache_key)
+        log.info(f"[Twitter] Cache HIT: {cache_key} ({int(age)}s)")
+        return set(cached.get('usernames', []))
+    
+    def _cache_put(self, cache_key: str, usernames: Set[str]) -> List[Tuple[str, Any]]:
+        """Insert as most recent and evict LRU entries beyond TWITTER_CACHE_MAX; returns the changes to persist"""
+        entry = {'usernames': sorted(usernames), 'timestamp': time.time()}
+        self.cache[cache_key] = entry
+        self.cache.move_to_end(cache_key)
+        changes = [(cache_key, entry)]
+        while len(self.cache) > TWITTER_CACHE_MAX:
+            changes.append((self.cache.popitem(last=False)[0], None))
+        return changes
+    
+    async def _try_service(self, url: str, service: Dict, timeout: int = None) -> Optional[Set[str]]:
+        """Stream one reader-service page and scan it for usernames as it arrives (None = failed)"""
+        actual_timeout = timeout or TWITTER_SCRAPE_TIMEOUT
         try:
             if service.get('prefix', True):
                 clean_url = url.replace('https://', '').replace('http://', '')
@@ -314,99 +454,165 @@ class TwitterScraper:
             else:
                 fetch_url = service['url'] + url
             
-            actual_timeout = timeout or TWITTER_SCRAPE_TIMEOUT
-            response = SESSION.get(fetch_url, headers=HEADERS, timeout=actual_timeout)
+            async with _http().get(fetch_url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=actual_timeout)) as response:
+                if response.status != 200:
+                    log.warning(f"[Twitter] ❌ {service['name']} FAILED: Status {response.status}")
+                    return None
+                found, size, complete = await self._scan_stream(response)
             
-            if response.status_code == 200 and len(response.text) > 500:
-                log.info(f"[Twitter] ✅ {service['name']} SUCCESS: {len(response.text):,} chars")
-                return response.text
+            if size > 500:
+                log.info(f"[Twitter] ✅ {service['name']} SUCCESS: {size:,} bytes{'' if complete else ' (stopped early)'}, {len(found)} usernames")
+                return found
             else:
-                log.warning(f"[Twitter] ❌ {service['name']} FAILED: Status {response.status_code}, {len(response.text)} chars")
+                log.warning(f"[Twitter] ❌ {service['name']} FAILED: Status {response.status}, {size} bytes")
                 return None
                 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             log.warning(f"[Twitter] ❌ {service['name']} TIMEOUT after {actual_timeout}s")
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             log.warning(f"[Twitter] ❌ {service['name']} CONNECTION ERROR: {str(e)[:100]}")
         except Exception as e:
             log.warning(f"[Twitter] ❌ {service['name']} ERROR: {type(e).__name__}: {str(e)[:100]}")
         return None
     
-    def _fetch_readable(self, url: str, timeout: int = None, preferred_service: int = None) -> Optional[str]:
+    async def _scan_stream(self, response: aiohttp.ClientResponse) -> Tuple[Set[str], int, bool]:
+        """
+        Run the username patterns over the raw body chunk by chunk instead of buffering the whole page.
+        Each scan ends at a line break and the next one re-reads the last ~256 bytes from a line start,
+        so ^-anchored and line-spanning patterns still see whole matches (duplicates just collapse).
+        On very long lines (minified HTML) only those 256 bytes are kept, with a "\\x00" head so `^`
+        can't match at the cut; otherwise the whole line would be rescanned on every chunk.
+        The "\\n\\x00" tail keeps `$` from matching at a block end that isn't the end of the page.
+        Stops reading once TWITTER_MAX_USERNAMES are found or TWITTER_MAX_PAGE_BYTES are read.
+        Returns (usernames, bytes read, read to end).
+        """
+        found: Set[str] = set(); size = 0; buf = b""; head = b""  # head is b"\x00" while buf starts mid-line
+        async for chunk in response.content.iter_chunked(65536):
+            size += len(chunk)
+            buf += chunk
+            if size >= TWITTER_MAX_PAGE_BYTES:
+                return found | self.matcher.extract_usernames(head + buf), size, False
+            end = buf.rfind(b"\n")
+            if end <= 0: continue
+            found |= self.matcher.extract_usernames(head + buf[:end] + b"\n\x00")
+            if len(found) >= TWITTER_MAX_USERNAMES:
+                return found, size, False
+            keep = max(0, end - 256)
+            cut = buf.rfind(b"\n", max(0, keep - 256), keep)
+            if cut >= 0:
+                buf = buf[cut + 1:]; head = b""
+            elif keep:
+                buf = buf[keep:]; head = b"\x00"
+        found |= self.matcher.extract_usernames(head + buf)
+        return found, size, True
+    
+    async def _fetch_readable(self, url: str, timeout: int = None, preferred_service: int = None) -> Optional[Set[str]]:
+        """Usernames from the first reader service that returns the page (None if all fail)"""
         log.info(f"[Twitter] Attempting to fetch: {url[:80]}...")
+        tried: List[Dict] = []
         
         if preferred_service is not None and 0 <= preferred_service < len(READER_SERVICES):
             service = READER_SERVICES[preferred_service]
             log.info(f"[Twitter] Trying PREFERRED service: {service['name']}")
-            result = self._try_service(url, service, timeout)
-            if result:
+            result = await self._try_service(url, service, timeout)
+            if result is not None:
                 self.successful_service = service
                 return result
+            tried.append(service)
         
-        if self.successful_service:
+        if self.successful_service and self.successful_service not in tried:
             log.info(f"[Twitter] Trying LAST SUCCESSFUL service: {self.successful_service['name']}")
-            result = self._try_service(url, self.successful_service, timeout)
-            if result:
+            result = await self._try_service(url, self.successful_service, timeout)
+            if result is not None:
                 return result
             else:
                 log.warning(f"[Twitter] Last successful service {self.successful_service['name']} failed, trying others...")
+            tried.append(self.successful_service)
         
-        log.info(f"[Twitter] Rotating through all {len(READER_SERVICES)} services...")
-        for i, service in enumerate(READER_SERVICES):
-            if preferred_service == i:
-                continue
-            
-            log.info(f"[Twitter] [{i+1}/{len(READER_SERVICES)}] Trying: {service['name']}")
-            result = self._try_service(url, service, timeout)
-            
-            if result:
-                self.successful_service = service
-                log.info(f"[Twitter] ✅ {service['name']} succeeded! Will use this service first next time.")
+        services = [svc for svc in READER_SERVICES if svc not in tried]
+        if services:
+            log.info(f"[Twitter] Racing {len(services)} services: {', '.join(svc['name'] for svc in services)}")
+            result = await self._race_services(url, services, timeout)
+            if result is not None:
                 return result
-            
-            time.sleep(0.3)
         
         log.error(f"[Twitter] ❌ ALL {len(READER_SERVICES)} services failed for: {url[:80]}")
         return None
     
-    def scrape_url(self, url: str, use_cache: bool = True, timeout: int = None, preferred_service: int = None) -> Set[str]:
+    async def _race_services(self, url: str, services: List[Dict], timeout: int = None) -> Optional[Set[str]]:
+        """Query services concurrently; the first usable page wins and the rest are cancelled"""
+        tasks = {asyncio.create_task(self._try_service(url, svc, timeout)): svc for svc in services}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    result = t.result()  # _try_service logs and swallows its own errors
+                    if result is not None:
+                        self.successful_service = tasks[t]
+                        log.info(f"[Twitter] ✅ {tasks[t]['name']} won the race! Will use this service first next time.")
+                        return result
+            return None
+        finally:
+            for t in pending:
+                t.cancel()
+    
+    async def scrape_url(self, url: str, use_cache: bool = True, timeout: int = None, preferred_service: int = None) -> Set[str]:
         if not TWITTER_SCRAPER_ENABLED or not url:
             return set()
         
-        if use_cache:
-            cached = self.get_cached_usernames(url)
-            if cached is not None:
-                return cached
+        if not use_cache:
+            return await self._scrape(url, timeout, preferred_service)
         
+        cached = self.get_cached_usernames(url)
+        if cached is not None:
+            return cached
+        
+        # Alerts fan out to every subscriber at once; coalesce their scrapes of the same target
+        key = self._get_cache_key(url)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._scrape(url, timeout, preferred_service))
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        else:
+            log.info(f"[Twitter] Joining in-flight scrape: {key}")
+        return set(await asyncio.shield(task))
+    
+    async def _scrape(self, url: str, timeout: int = None, preferred_service: int = None) -> Set[str]:
         log.info(f"[Twitter] 🔍 Starting scrape: {url}")
         log.info(f"[Twitter] Config: timeout={timeout or TWITTER_SCRAPE_TIMEOUT}s, preferred_service={preferred_service}, available_services={len(READER_SERVICES)}")
         
         variants = self.url_generator.generate(url)
         all_usernames = set()
-        services_tried = []
         
-        for i, variant in enumerate(variants):
-            log.info(f"[Twitter] Trying variant {i+1}/{len(variants)}: {variant}")
-            content = self._fetch_readable(variant, timeout=timeout, preferred_service=preferred_service)
-            
-            if content:
-                usernames = self.matcher.extract_usernames(content)
-                log.info(f"[Twitter] ✅ Extracted {len(usernames)} usernames from variant {i+1}")
-                all_usernames.update(usernames)
-                
-                if len(all_usernames) >= TWITTER_MAX_USERNAMES:
-                    log.info(f"[Twitter] Reached max usernames ({TWITTER_MAX_USERNAMES}), stopping")
-                    break
-            else:
-                log.warning(f"[Twitter] ❌ No content retrieved from variant {i+1}")
-            
-            if i < len(variants) - 1:
-                time.sleep(0.5)
+        # Variants are fetched concurrently (bounded, so the reader services aren't hit with every
+        # variant at once); results merge as they land and the rest are cancelled at the cap
+        sem = asyncio.Semaphore(TWITTER_VARIANT_CONCURRENCY)
+        async def fetch_variant(i: int, variant: str) -> Tuple[int, Optional[Set[str]]]:
+            async with sem:
+                log.info(f"[Twitter] Trying variant {i+1}/{len(variants)}: {variant}")
+                return i, await self._fetch_readable(variant, timeout=timeout, preferred_service=preferred_service)
+        
+        tasks = [asyncio.create_task(fetch_variant(i, v)) for i, v in enumerate(variants)]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                i, usernames = await fut
+                if usernames is not None:
+                    log.info(f"[Twitter] ✅ Extracted {len(usernames)} usernames from variant {i+1}")
+                    all_usernames.update(usernames)
+                    
+                    if len(all_usernames) >= TWITTER_MAX_USERNAMES:
+                        log.info(f"[Twitter] Reached max usernames ({TWITTER_MAX_USERNAMES}), stopping")
+                        break
+                else:
+                    log.warning(f"[Twitter] ❌ No content retrieved from variant {i+1}")
+        finally:
+            for t in tasks:
+                t.cancel()
         
         if all_usernames:
             cache_key = self._get_cache_key(url)
-            self.cache[cache_key] = {'usernames': sorted(all_usernames), 'timestamp': time.time()}
-            self._save_cache()
+            await self.persist_cache(self._cache_put(cache_key, all_usernames))
             log.info(f"[Twitter] ✅ SUCCESS: Found {len(all_usernames)} unique usernames, cached as '{cache_key}'")
         else:
             log.error(f"[Twitter] ❌ FAILED: No usernames found after trying {len(variants)} variants with {len(READER_SERVICES)} services")
@@ -422,41 +628,131 @@ twitter_scraper = TwitterScraper()
 # -----------------------------------------------------------------------------
 # Subs persistence
 # -----------------------------------------------------------------------------
+# SUBS_FILE is a snapshot of bare chat ids followed by appended "+ <id>" / "- <id>" records,
+# so a subscribe toggle is one small append instead of a full rewrite.
 SUBS: Set[int] = set()
+_SUBS_LOG_LEN = 0  # records currently in SUBS_FILE
+_SUBS_LOAD_OK = False  # SUBS_FILE was read; until then (or if reading failed) it is never compacted over
+_SUBS_VIEW: Optional[array] = None  # sorted packed copy of SUBS for fan-out, rebuilt on change
+
+def _subs_view() -> array:
+    """Sorted int64 snapshot of SUBS; reused across ticks until a sub is added or removed"""
+    global _SUBS_VIEW
+    if _SUBS_VIEW is None:
+        _SUBS_VIEW = array("q", sorted(SUBS))
+    return _SUBS_VIEW
+
+def _invalidate_subs_view() -> None:
+    global _SUBS_VIEW
+    _SUBS_VIEW = None
 
 def _load_subs_from_file() -> Set[int]:
+    """Replay SUBS_FILE; sets _SUBS_LOAD_OK so a file that couldn't be read is left alone"""
+    global _SUBS_LOG_LEN, _SUBS_LOAD_OK
     p = pathlib.Path(SUBS_FILE)
-    if not p.exists(): return set()
+    if not p.exists():
+        _SUBS_LOAD_OK = True; return set()
     try:
-        return {int(x.strip()) for x in p.read_text().splitlines() if x.strip()}
+        out: Set[int] = set(); n = bad = 0
+        with open(p) as f:  # line by line, no whole-file string + line list
+            for x in f:
+                x = x.strip()
+                if not x: continue
+                n += 1
+                op, sep, cid = x.partition(" ")
+                try:
+                    if not sep: out.add(int(x))
+                    elif op == "-": out.discard(int(cid))
+                    elif op == "+": out.add(int(cid))
+                    else: raise ValueError(x)
+                except ValueError:
+                    bad += 1  # torn record from an interrupted append; the rest of the log still applies
+        if bad: log.warning("subs load skipped %d bad line(s)", bad)
+        _SUBS_LOG_LEN = n; _SUBS_LOAD_OK = True
+        return out
     except Exception as e:
-        log.warning("subs load failed: %r", e); return set()
+        _SUBS_LOAD_OK = False
+        log.error("subs load failed, leaving %s untouched: %r", SUBS_FILE, e); return set()
 
-def _save_subs_to_file():
+def _save_subs_to_file(subs: array) -> bool:
+    """Compact SUBS_FILE into a plain snapshot of `subs` (a sorted _subs_view()), atomic replace.
+    Returns False without writing if the file wasn't loaded or `subs` is empty and the file isn't."""
+    global _SUBS_LOG_LEN
     try:
-        pathlib.Path(SUBS_FILE).parent.mkdir(parents=True, exist_ok=True)
-        pathlib.Path(SUBS_FILE).write_text("\n".join(str(x) for x in sorted(SUBS)))
+        p = pathlib.Path(SUBS_FILE)
+        if not _SUBS_LOAD_OK or (not subs and p.exists() and p.stat().st_size):
+            return False
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_text("\n".join(str(x) for x in subs))
+        os.replace(tmp, p)
+        _SUBS_LOG_LEN = len(subs)
+        return True
     except Exception as e:
         log.error("subs save failed: %r", e)
+        return False
+
+def _append_sub_changes(lines: List[str]) -> None:
+    global _SUBS_LOG_LEN
+    try:
+        p = pathlib.Path(SUBS_FILE)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(p, "a") as f:
+            f.write("".join("\n" + x for x in lines))
+        _SUBS_LOG_LEN += len(lines)
+    except Exception as e:
+        log.error("subs append failed: %r", e)
+
+# Sub changes are queued and written by one background flush ~0.5s later, off the event loop,
+# so a burst of /subscribe, /unsubscribe or bad-chat removals costs one append (or one compaction)
+SUBS_FLUSH_DELAY_SEC = 0.5
+_SUBS_PENDING: List[str] = []
+_SUBS_FLUSH_TASK: Optional[asyncio.Task] = None
+_SUBS_LOCK = asyncio.Lock()
+
+async def flush_subs(delay: float = 0.0) -> None:
+    """Write queued sub changes (compacting the log when it has grown past 2x the set)"""
+    global _SUBS_PENDING
+    if delay: await asyncio.sleep(delay)
+    async with _SUBS_LOCK:
+        while _SUBS_PENDING:
+            lines, _SUBS_PENDING = _SUBS_PENDING, []
+            compact = _SUBS_LOG_LEN + len(lines) > max(64, 2 * len(SUBS))
+            # A refused or failed compaction still records the changes as appends
+            if not (compact and await asyncio.to_thread(_save_subs_to_file, _subs_view())):
+                await asyncio.to_thread(_append_sub_changes, lines)
+
+def _log_sub_change(op: str, cid: int) -> None:
+    global _SUBS_FLUSH_TASK
+    _SUBS_PENDING.append(f"{op} {cid}")
+    if _SUBS_FLUSH_TASK is None or _SUBS_FLUSH_TASK.done():
+        _SUBS_FLUSH_TASK = asyncio.create_task(flush_subs(SUBS_FLUSH_DELAY_SEC))
+        BACKGROUND_TASKS.add(_SUBS_FLUSH_TASK)
+        _SUBS_FLUSH_TASK.add_done_callback(BACKGROUND_TASKS.discard)
+
+def _add_sub(cid: int) -> None:
+    if cid not in SUBS:
+        SUBS.add(cid); _invalidate_subs_view(); _log_sub_change("+", cid)
+
+def _discard_sub(cid: int) -> None:
+    if cid in SUBS:
+        SUBS.discard(cid); _invalidate_subs_view(); _log_sub_change("-", cid)
 
 async def _validate_subs(bot) -> None:
-    global SUBS
-    bad=set()
-    for cid in list(SUBS):
-        try:
-            await bot.get_chat(cid)
-        except BadRequest as e:
-            log.warning(f"Removing invalid subscriber {cid}: {getattr(e, 'message', str(e))}"); bad.add(cid)
-        except Exception as e:
-            log.warning(f"Subscriber check error for {cid}: {e}")
-    if bad:
-        SUBS -= bad
-        _save_subs_to_file()
+    """get_chat every subscriber concurrently (bounded by the send semaphore); drop the ones Telegram rejects"""
+    async def check(cid):
+        async with _SEND_SEM:
+            return await bot.get_chat(cid)
+    subs = _subs_view()
+    results = await asyncio.gather(*(check(cid) for cid in subs), return_exceptions=True)
+    for cid, res in zip(subs, results):
+        if isinstance(res, BadRequest):
+            log.warning(f"Removing invalid subscriber {cid}: {getattr(res, 'message', str(res))}"); _discard_sub(cid)
+        elif isinstance(res, Exception):
+            log.warning(f"Subscriber check error for {cid}: {res}")
 
 def _remove_bad_sub(cid:int):
-    global SUBS
-    if cid in SUBS:
-        SUBS.remove(cid); _save_subs_to_file()
+    _discard_sub(cid)
 
 # -----------------------------------------------------------------------------
 # Helpers
@@ -464,6 +760,33 @@ def _remove_bad_sub(cid:int):
 def html_escape(s: str) -> str:
     return (s or "").replace("&","&amp;").replace("<","&lt;").replace(">","&gt;")
 
+class TokenBucket:
+    """Async token bucket: `rate` permits per second, bursts up to `capacity`."""
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._ts = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._ts) * self.rate)
+                self._ts = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+
 def _pair_age_minutes(now_ms, created_ms):
     try:
         return float("inf") if not created_ms else max(0.0, (now_ms - float(created_ms)) / 60000.0)
@@ -479,37 +802,86 @@ def _normalize_ipfs(url: str) -> Optional[str]:
 def _is_svg(url: str, ct: str) -> bool:
     return url.lower().endswith(".svg") or "image/svg" in (ct or "").lower()
 
-def _fetch_image_bytes(url: str) -> Optional[bytes]:
+IMAGE_MAX_BYTES = 8*1024*1024
+
+async def _fetch_image_bytes(url: str) -> Optional[bytes]:
+    """Stream the image, giving up as soon as it is known (or seen) to reach IMAGE_MAX_BYTES"""
     try:
-        r = SESSION.get(url, timeout=10)
-        if r.status_code != 200: return None
-        if _is_svg(url, r.headers.get("Content-Type","")): return None
-        data = r.content
-        return data if data and len(data) < 8*1024*1024 else None
+        async with _http().get(url, timeout=aiohttp.ClientTimeout(total=10)) as r:
+            if r.status != 200: return None
+            if _is_svg(url, r.headers.get("Content-Type","")): return None
+            if (r.content_length or 0) >= IMAGE_MAX_BYTES: return None
+            buf = bytearray()
+            async for chunk in r.content.iter_chunked(65536):
+                buf += chunk
+                if len(buf) >= IMAGE_MAX_BYTES: return None
+        return bytes(buf) if buf else None
     except Exception:
         return None
 
+# Logos are fetched once per URL for all chats (failures briefly too, so a dead candidate isn't retried
+# per chat), and once Telegram has a copy its file_id is sent instead and the bytes are dropped
+LOGO_CACHE_TTL_SEC = 3600
+LOGO_NEG_TTL_SEC   = float(os.getenv("LOGO_NEG_TTL_SEC", "10"))  # a failed fetch is retried after this long
+LOGO_CACHE_MAX_BYTES = int(os.getenv("LOGO_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+_LOGO_CACHE: "OrderedDict[str, Tuple[float, Optional[bytes]]]" = OrderedDict()
+_LOGO_CACHE_BYTES = 0  # total size of the bytes held in _LOGO_CACHE
+_LOGO_CACHE_MAX = 1024  # entries, so cached failures (no bytes) stay bounded too
+_LOGO_INFLIGHT: Dict[str, asyncio.Task] = {}
+_LOGO_FILE_IDS: "OrderedDict[str, str]" = OrderedDict()
+_LOGO_FILE_IDS_MAX = 4096
+
+def _logo_cache_drop(url: str) -> None:
+    global _LOGO_CACHE_BYTES
+    hit = _LOGO_CACHE.pop(url, None)
+    if hit and hit[1]: _LOGO_CACHE_BYTES -= len(hit[1])
+
+def _logo_cache_put(url: str, data: Optional[bytes]) -> None:
+    """Insert as most recent and evict LRU entries until the cache fits LOGO_CACHE_MAX_BYTES and _LOGO_CACHE_MAX"""
+    global _LOGO_CACHE_BYTES
+    _logo_cache_drop(url)
+    if data and len(data) > LOGO_CACHE_MAX_BYTES: return
+    _LOGO_CACHE[url] = (time.monotonic(), data)
+    if data: _LOGO_CACHE_BYTES += len(data)
+    while _LOGO_CACHE_BYTES > LOGO_CACHE_MAX_BYTES or len(_LOGO_CACHE) > _LOGO_CACHE_MAX:
+        _logo_cache_drop(next(iter(_LOGO_CACHE)))
+
+async def _logo_bytes(url: str) -> Optional[bytes]:
+    hit = _LOGO_CACHE.get(url)
+    if hit and time.monotonic() - hit[0] < (LOGO_CACHE_TTL_SEC if hit[1] else LOGO_NEG_TTL_SEC):
+        _LOGO_CACHE.move_to_end(url)
+        return hit[1]
+    task = _LOGO_INFLIGHT.get(url)
+    if task is None:
+        task = _LOGO_INFLIGHT[url] = asyncio.create_task(_fetch_image_bytes(url))
+        task.add_done_callback(lambda _t, u=url: _LOGO_INFLIGHT.pop(u, None))
+    data = await asyncio.shield(task)
+    if url not in _LOGO_FILE_IDS:  # a concurrent send may already have uploaded it
+        _logo_cache_put(url, data)
+    return data
+
+def _remember_logo_file_id(url: str, msg) -> None:
+    if getattr(msg, "photo", None):
+        _LOGO_FILE_IDS[url] = msg.photo[-1].file_id
+        _LOGO_FILE_IDS.move_to_end(url)
+        while len(_LOGO_FILE_IDS) > _LOGO_FILE_IDS_MAX:
+            _LOGO_FILE_IDS.popitem(last=False)
+        _logo_cache_drop(url)  # later sends use the file_id; the bytes are only refetched if it's rejected
+
 def _logo_candidates(mint: str, image_url: Optional[str]) -> List[str]:
     cands: List[str] = []
     if image_url: 
         cands.append(_normalize_ipfs(image_url))
     if mint:
         cands.append(f"https://cdn.dexscreener.com/token-icons/solana/{mint}.png")
-    if mint:
         cands.append(f"https://dd.dexscreener.com/ds-data/tokens/solana/{mint}.png")
-    out=[]; seen=set()
-    for u in cands:
-        if u and u not in seen: 
-            out.append(u)
-            seen.add(u)
-    return out
+    return list(dict.fromkeys(u for u in cands if u))  # ordered dedup
 
 def _normalize_handle(s: str) -> Optional[str]:
     s = (s or "").strip()
     if not s: return None
     if s.startswith("@"): s=s[1:]
     if s.startswith("http"):
-        from urllib.parse import urlparse
         try:
             u=urlparse(s); parts=[p for p in (u.path or "").split("/") if p]
             if parts: s=parts[0]
@@ -520,23 +892,25 @@ def _canon_url(u: Optional[str]) -> Optional[str]:
     if not u: return None
     u=u.strip()
     if u.startswith("//"): u="https:" + u
-    if not (u.startswith("http://") or u.startswith("https://")): u="https://" + u
+    if not u.startswith(("http://", "https://")): u="https://" + u
     return u
 
-_URL_OK = re.compile(r"^https?://[^\s]+$", re.IGNORECASE)
+_URL_OK = re.compile(r"https?://[^\s]+", re.IGNORECASE)  # used with fullmatch
 def _valid_url(u: Optional[str]) -> Optional[str]:
     u = _canon_url(u)
-    return u if (u and _URL_OK.match(u)) else None
+    return u if (u and _URL_OK.fullmatch(u)) else None
 
+@lru_cache(maxsize=4096)  # pure; the same X links come back every updater tick
 def _handle_from_url(u: str) -> Optional[str]:
-    from urllib.parse import urlparse
     try:
         pu=urlparse(u); parts=[p for p in (pu.path or "").split("/") if p]
         return _normalize_handle(parts[0] if parts else "")
     except: return None
 
+_X_LINK_RE = re.compile(r"twitter|x\.com", re.I)  # matched on the raw URL, no lowercased copy
+
 def _extract_x(info: dict) -> Tuple[Optional[str], Optional[str]]:
-    if not isinstance(info, dict): return (None, None)
+    if not isinstance(info, dict) or not info: return (None, None)  # most fresh pairs carry no socials
     for key in ("socials","links","websites"):
         arr = info.get(key)
         if isinstance(arr, list):
@@ -545,18 +919,18 @@ def _extract_x(info: dict) -> Tuple[Optional[str], Optional[str]]:
                 url = it.get("url") or it.get("link")
                 plat = (it.get("platform") or it.get("type") or it.get("label") or "").lower()
                 handle = it.get("handle")
-                if url and ("twitter" in url.lower() or "x.com" in url.lower() or "twitter" in plat or "x" == plat):
+                if url and (_X_LINK_RE.search(url) or "twitter" in plat or "x" == plat):
                     u = _canon_url(url)
-                    if "/i/communities/" in u.lower() or "/communities/" in u.lower():
+                    if "/communities/" in u.lower():  # also covers /i/communities/
                         return (None, u)
                     h = _handle_from_url(u) or _normalize_handle(handle or "")
                     return (h, u)
     for key in ("twitterUrl","twitter","x","twitterHandle"):
         v = info.get(key)
         if isinstance(v, str) and v.strip():
-            if v.lower().startswith("http"):
+            if v[:4].lower() == "http":
                 u=_canon_url(v)
-                if "/i/communities/" in u.lower() or "/communities/" in u.lower():
+                if "/communities/" in u.lower():
                     return (None, u)
                 return (_handle_from_url(u), u)
             h=_normalize_handle(v)
@@ -580,54 +954,163 @@ SEARCH_ALL_URL     = "https://api.dexscreener.com/latest/dex/search?q=chain:{cha
 TOKEN_PAIRS_URL    = "https://api.dexscreener.com/token-pairs/v1/{chainId}/{address}"
 PAIR_REFRESH_URL   = "https://api.dexscreener.com/latest/dex/pairs/{chainId}/{pairId}"
 
-def _get_json(url, timeout=HTTP_TIMEOUT, tries=2):
+# Paces Dexscreener requests proactively instead of bursting into 429s
+DEX_LIMITER = TokenBucket(DEX_RPS)
+# Caps Dexscreener requests in flight when lookups are gathered
+_DEX_SEM = asyncio.Semaphore(DEX_CONCURRENCY)
+
+# url -> (fetched_at monotonic, data, etag, last_modified); insertion-ordered for FIFO eviction
+_JSON_CACHE: Dict[str, Tuple[float, Any, str, str]] = {}
+_JSON_CACHE_MAX = 4096
+
+def _json_cache_put(url: str, data: Any, etag: str, last_modified: str) -> None:
+    _JSON_CACHE.pop(url, None)
+    _JSON_CACHE[url] = (time.monotonic(), data, etag, last_modified)
+    while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+        del _JSON_CACHE[next(iter(_JSON_CACHE))]
+
+_JSON_FAILED: Dict[str, float] = {}  # url -> when its last fetch gave up
+_JSON_INFLIGHT: Dict[str, asyncio.Task] = {}
+
+async def _get_json(url, timeout=HTTP_TIMEOUT, tries=2, ttl=DEX_CACHE_TTL_SEC):
+    """Cached GET: fresh hits and recent failures skip the network; concurrent callers share one request"""
+    hit = _JSON_CACHE.get(url); now = time.monotonic()
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    failed = _JSON_FAILED.get(url)
+    if failed is not None and now - failed < DEX_NEG_TTL_SEC:
+        return None
+    task = _JSON_INFLIGHT.get(url)
+    if task is None:
+        task = _JSON_INFLIGHT[url] = asyncio.create_task(_fetch_json(url, hit, timeout, tries))
+        task.add_done_callback(lambda _t, u=url: _JSON_INFLIGHT.pop(u, None))
+    return await asyncio.shield(task)
+
+async def _fetch_json(url, hit, timeout, tries):
+    headers = {}
+    if hit:
+        if hit[2]: headers["If-None-Match"] = hit[2]
+        if hit[3]: headers["If-Modified-Since"] = hit[3]
     for i in range(tries):
+        delay = min(30.0, 2**i + random.random())
         try:
             log.debug(f"[API] GET {url} (attempt {i+1}/{tries})")
-            r = SESSION.get(url, timeout=timeout)
-            if r.status_code == 200: 
-                data = r.json()
-                return data
+            async with _DEX_SEM, DEX_LIMITER:
+                async with _http().get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=HTTP_CONNECT_TIMEOUT)) as r:
+                    if r.status == 200:
+                        data = orjson.loads(await r.read())
+                        _json_cache_put(url, data, r.headers.get("ETag", ""), r.headers.get("Last-Modified", ""))
+                        _JSON_FAILED.pop(url, None)
+                        return data
+                    if r.status == 304 and hit:
+                        _json_cache_put(url, hit[1], hit[2], hit[3])
+                        _JSON_FAILED.pop(url, None)
+                        return hit[1]
+                    if r.status == 429:
+                        try: delay = min(30.0, float(r.headers.get("Retry-After") or delay))
+                        except ValueError: pass
+                        log.warning(f"[API] 429 on {url}, retrying in {delay:.1f}s")
         except Exception as e:
-            log.warning(f"[API] Error on {url}: {e}")
-        time.sleep(0.2*(i+1))
+            if i < tries - 1:
+                log.debug("[API] Error on %s (attempt %d/%d): %r", url, i + 1, tries, e)
+            else:
+                log.warning(f"[API] Error on {url}: {e!r}")
+        if i < tries - 1:
+            await asyncio.sleep(delay)
+    if len(_JSON_FAILED) >= _JSON_CACHE_MAX: _JSON_FAILED.clear()
+    _JSON_FAILED[url] = time.monotonic()
     return None
 
-def _discover_profiles_latest(chain=CHAIN_ID) -> List[dict]:
-    arr = _get_json(TOKEN_PROFILES_URL, timeout=15) or []
+async def _discover_profiles_latest(chain=CHAIN_ID) -> List[dict]:
+    arr = await _get_json(TOKEN_PROFILES_URL, timeout=15) or []
     result = [x for x in arr if isinstance(x,dict) and (x.get("chainId") or "").lower()==chain]
     return result
 
-def _best_pool_for_mint(chain, mint) -> Optional[dict]:
-    url = TOKEN_PAIRS_URL.format(chainId=chain, address=mint)
-    arr = _get_json(url, timeout=15) or []
-    if not isinstance(arr,list) or not arr: return None
-    best=None; key=None
-    for p in arr:
-        liq = float((p.get("liquidity") or {}).get("usd",0) or 0)
-        created = float(p.get("pairCreatedAt") or 0)
-        k = (liq, created)
-        if best is None or k > key: best, key = p, k
+def _pool_rank(p: dict) -> Tuple[float, float]:
+    return (float((p.get("liquidity") or {}).get("usd",0) or 0), float(p.get("pairCreatedAt") or 0))
+
+TOKENS_BATCH_MAX = 30  # addresses per TOKENS_URL request (API limit)
+
+async def _best_pools_for_mints(chain, mints) -> Dict[str, dict]:
+    """Best pool per mint via TOKENS_URL, up to 30 addresses per request, chunks fetched in parallel"""
+    mints = sorted(set(m for m in mints if m))  # stable chunks keep the JSON cache warm across ticks
+    chunks = [mints[i:i+TOKENS_BATCH_MAX] for i in range(0, len(mints), TOKENS_BATCH_MAX)]
+    results = await asyncio.gather(*(
+        _get_json(TOKENS_URL.format(chainId=chain, addresses=",".join(c)), timeout=15) for c in chunks
+    ), return_exceptions=True)
+    wanted = set(mints); best: Dict[str, dict] = {}; best_rank: Dict[str, Tuple[float, float]] = {}
+    for arr in results:
+        if isinstance(arr, Exception):
+            log.warning(f"[API] tokens batch failed: {arr}"); continue
+        if not isinstance(arr, list): continue
+        for p in arr:
+            if not isinstance(p, dict): continue
+            rank = None  # computed once per pool, and only if one of its sides is wanted
+            for side in ("baseToken", "quoteToken"):
+                addr = (p.get(side) or {}).get("address")
+                if addr not in wanted: continue
+                if rank is None: rank = _pool_rank(p)
+                if addr not in best_rank or rank > best_rank[addr]:
+                    best[addr] = p; best_rank[addr] = rank
     return best
 
+async def _best_pool_for_mint(chain, mint) -> Optional[dict]:
+    return (await _best_pools_for_mints(chain, [mint])).get(mint)
+
 # -----------------------------------------------------------------------------
 # Mirror store
 # -----------------------------------------------------------------------------
+# Stored as a JSONL log keyed by (section, id), e.g. ("tokens", mint); only upserted rows are appended
+_MIRROR_DIRTY: Set[Tuple[str, str]] = set()
+_MIRROR_LOG_LEN = 0
+
 def _mirror_load() -> dict:
-    p=pathlib.Path(MIRROR_JSON)
-    if not p.exists(): return {"tokens":{},"pairs":{},"since":{}}
-    try: return json.loads(p.read_text())
-    except: return {"tokens":{},"pairs":{},"since":{}}
+    global _MIRROR_LOG_LEN
+    out = {"tokens":{},"pairs":{},"since":{}}
+    try: flat, _MIRROR_LOG_LEN = _jsonl_load(MIRROR_JSON)
+    except Exception: return out
+    for k, v in flat.items():
+        if isinstance(k, tuple) and len(k) == 2: out.setdefault(k[0], {})[k[1]] = v
+        elif isinstance(v, dict): out[k] = v  # legacy nested snapshot
+    return out
+
+def _mirror_flat(obj: dict) -> Dict[Tuple[str, str], Any]:
+    return {(sec, k): v for sec, rows in list(obj.items()) if isinstance(rows, dict) for k, v in list(rows.items())}
 
 def _mirror_save(obj: dict) -> None:
-    pathlib.Path(MIRROR_JSON).parent.mkdir(parents=True, exist_ok=True)
-    pathlib.Path(MIRROR_JSON).write_text(json.dumps(obj, indent=2))
+    """Compact MIRROR_JSON into a snapshot of obj"""
+    global _MIRROR_LOG_LEN
+    try:
+        flat = _mirror_flat(obj)
+        _jsonl_compact(MIRROR_JSON, flat)
+        _MIRROR_LOG_LEN = len(flat)
+    except Exception as e:
+        log.error("save mirror failed: %r", e)
 
+def _mirror_append(obj: dict, keys: Set[Tuple[str, str]]) -> None:
+    global _MIRROR_LOG_LEN
+    try:
+        _MIRROR_LOG_LEN += _jsonl_append(MIRROR_JSON, [(k, (obj.get(k[0]) or {}).get(k[1])) for k in keys])
+    except Exception as e:
+        log.error("append mirror failed: %r", e)
+    if _MIRROR_LOG_LEN > max(64, 2 * sum(len(v) for v in obj.values() if isinstance(v, dict))):
+        _mirror_save(obj)
+
+async def flush_mirror() -> None:
+    """Append rows upserted since the last flush, off the event loop"""
+    global _MIRROR_DIRTY
+    if not _MIRROR_DIRTY: return
+    keys, _MIRROR_DIRTY = _MIRROR_DIRTY, set()
+    async with _MIRROR_LOCK:
+        await asyncio.to_thread(_mirror_append, MIRROR, keys)
+
+_MIRROR_LOCK = asyncio.Lock()
 MIRROR = _mirror_load()
 
-def mirror_upsert_token(mint: str, pair: Optional[str], created_at: Optional[int], row: dict) -> None:
-    t = MIRROR["tokens"].get(mint) or {"first_seen": int(time.time()), "seen": 0}
-    t["last_seen"] = int(time.time())
+def mirror_upsert_token(mint: str, pair: Optional[str], created_at: Optional[int], row: dict, now: Optional[int] = None) -> None:
+    if now is None: now = int(time.time())
+    t = MIRROR["tokens"].get(mint) or {"first_seen": now, "seen": 0}
+    t["last_seen"] = now
     if created_at:
         try: t["pair_created_at"] = int(created_at)
         except: pass
@@ -635,16 +1118,19 @@ def mirror_upsert_token(mint: str, pair: Optional[str], created_at: Optional[int
     t["last"] = row
     t["seen"] += 1
     MIRROR["tokens"][mint] = t
+    _MIRROR_DIRTY.add(("tokens", mint))
 
-def mirror_upsert_pair(pair: str, chain: str, created_at: Optional[int], row: dict) -> None:
-    p = MIRROR["pairs"].get(pair) or {"chainId": chain, "first_seen": int(time.time()), "seen": 0}
-    p["last_seen"] = int(time.time())
+def mirror_upsert_pair(pair: str, chain: str, created_at: Optional[int], row: dict, now: Optional[int] = None) -> None:
+    if now is None: now = int(time.time())
+    p = MIRROR["pairs"].get(pair) or {"chainId": chain, "first_seen": now, "seen": 0}
+    p["last_seen"] = now
     if created_at:
         try: p["pair_created_at"] = int(created_at)
         except: pass
     p["last"] = row
     p["seen"] += 1
     MIRROR["pairs"][pair] = p
+    _MIRROR_DIRTY.add(("pairs", pair))
 
 def mirror_stats() -> dict:
     return {"tokens": len(MIRROR.get("tokens",{})), "pairs": len(MIRROR.get("pairs",{})), "since": MIRROR.get("since",{})}
@@ -661,87 +1147,122 @@ def _normalize_row_to_token(row: dict) -> Tuple[str, Optional[str], Optional[int
 
 async def ingester(context: ContextTypes.DEFAULT_TYPE):
     try:
-        log.info("[Ingester] Starting cycle")
-        profiles = _discover_profiles_latest(CHAIN_ID)
-        log.info(f"[Ingester] Got {len(profiles)} profiles")
+        profiles = await _discover_profiles_latest(CHAIN_ID)
+        
+        profiles = [p for p in profiles if p.get("tokenAddress")]
+        pools = await _best_pools_for_mints(CHAIN_ID, [p["tokenAddress"] for p in profiles])
         
-        processed = 0
+        processed = 0; now_ts = int(time.time())  # one timestamp for the whole cycle
         for profile in profiles:
-            mint = profile.get("tokenAddress")
-            if not mint: continue
-            best = _best_pool_for_mint(CHAIN_ID, mint)
+            best = pools.get(profile["tokenAddress"])
             if best:
+                # Copy before merging profile data: the pool row may be shared with the JSON cache
+                best = {**best, "info": dict(best.get("info") or {})}
                 mint_b, pair_b, created_b = _normalize_row_to_token(best)
                 if "links" in profile and profile["links"]:
-                    if "info" not in best: best["info"] = {}
                     best["info"]["links"] = profile["links"]
                 if "icon" in profile and profile["icon"]:
-                    if "info" not in best: best["info"] = {}
                     best["info"]["imageUrl"] = profile["icon"]
-                if pair_b: mirror_upsert_pair(pair_b, CHAIN_ID, created_b, best)
-                if mint_b: mirror_upsert_token(mint_b, pair_b, created_b, best)
+                if pair_b: mirror_upsert_pair(pair_b, CHAIN_ID, created_b, best, now_ts)
+                if mint_b: mirror_upsert_token(mint_b, pair_b, created_b, best, now_ts)
                 processed += 1
-        _mirror_save(MIRROR)
-        log.info(f"[Ingester] Complete! Processed: {processed}")
+        await flush_mirror()
+        log.info(f"[Ingester] cycle profiles={len(profiles)} processed={processed}")
     except Exception as e:
         log.exception(f"[Ingester] ERROR: {e}")
 
 # -----------------------------------------------------------------------------
 # Mirror -> pairs rows
 # -----------------------------------------------------------------------------
+# mint -> (mirror row it was built from, built row without age_min); the ingester stores a new
+# row object on every upsert, so an identity check tells whether the cached build is still current
+_ROW_CACHE: Dict[str, Tuple[dict, dict]] = {}
+
 def _pairs_from_mirror() -> List[dict]:
-    rows=[]; now_ms=time.time()*1000.0
-    for mint, rec in MIRROR.get("tokens",{}).items():
+    # One row per token (highest liquidity wins), sorted by market cap, picked in the same pass that builds the rows
+    best: Dict[str, Tuple[float, dict]] = {}; now_ms=time.time()*1000.0
+    tokens = MIRROR.get("tokens",{})
+    for mint, rec in tokens.items():
         row = rec.get("last") or {}
         if not row: continue
-        base=row.get("baseToken") or {}; info=row.get("info") or {}
-        name  = base.get("symbol") or base.get("name") or "Unknown"
-        token = base.get("address") or mint
-        pair  = row.get("pairAddress") or (rec.get("last_pair") or "")
-        price = _get_price_usd(row)
+        # Reject on the cheap raw fields first so filtered-out rows skip URL/social parsing
         liq   = float((row.get("liquidity") or {}).get("usd",0) or 0)
-        fdv   = row.get("fdv")
-        mcap  = float(fdv if fdv is not None else (row.get("marketCap") or 0) or 0)
-        vol24 = float((row.get("volume") or {}).get("h24",0) or 0)
-        url   = _valid_url(row.get("url") or (DEXSCREENER_PAIR_URL.format(pair=pair) if pair else ""))
         age_m = _pair_age_minutes(now_ms, row.get("pairCreatedAt"))
-        x_handle, x_url = _extract_x(info)
-        
-        if x_url:
-            tw_url_final = x_url
-        elif x_handle:
-            tw_url_final = X_USER_URL.format(handle=x_handle)
-        else:
-            tw_url_final = "https://x.com/"
-        
-        rows.append({
-            "name": name, "token": token, "pair": pair, "price_usd": price,
-            "liquidity_usd": liq, "mcap_usd": mcap, "vol24_usd": vol24, "age_min": age_m,
-            "url": url, "logo_hint": info.get("imageUrl") or base.get("logo") or "",
-            "tw_url": tw_url_final,
-            "tw_handle": x_handle,
-            "axiom": AXIOM_WEB_URL.format(pair=pair) if pair else "https://axiom.trade/",
-            "gmgn": GMGN_WEB_URL.format(mint=token) if token else "https://gmgn.ai/",
-        })
-    return rows
+        if liq < MIN_LIQ_USD or age_m > MAX_AGE_MIN: continue
+        hit = _ROW_CACHE.get(mint)
+        if hit is None or hit[0] is not row:
+            hit = _ROW_CACHE[mint] = (row, _build_pair_row(mint, rec, row, liq))
+        tok = hit[1].get("token") or ""
+        if not tok: continue
+        cur = best.get(tok)
+        if cur is not None and liq <= cur[0]: continue
+        # Callers annotate rows in place, so each tick gets its own copy
+        best[tok] = (liq, {**hit[1], "age_min": age_m})
+    for mint in _ROW_CACHE.keys() - tokens.keys():
+        del _ROW_CACHE[mint]
+    return sorted((p for _, p in best.values()), key=lambda x:float(x.get("mcap_usd") or 0), reverse=True)
+
+def _build_pair_row(mint: str, rec: dict, row: dict, liq: float) -> dict:
+    base=row.get("baseToken") or {}; info=row.get("info") or {}
+    name  = base.get("symbol") or base.get("name") or "Unknown"
+    token = base.get("address") or mint
+    pair  = row.get("pairAddress") or (rec.get("last_pair") or "")
+    price = _get_price_usd(row)
+    fdv   = row.get("fdv")
+    mcap  = float(fdv if fdv is not None else (row.get("marketCap") or 0) or 0)
+    vol24 = float((row.get("volume") or {}).get("h24",0) or 0)
+    url   = _valid_url(row.get("url") or (DEXSCREENER_PAIR_URL.format(pair=pair) if pair else ""))
+    x_handle, x_url = _extract_x(info)
+    
+    if x_url:
+        tw_url_final = x_url
+    elif x_handle:
+        tw_url_final = X_USER_URL.format(handle=x_handle)
+    else:
+        tw_url_final = "https://x.com/"
+    
+    return {
+        "name": name, "token": token, "pair": pair, "price_usd": price,
+        "liquidity_usd": liq, "mcap_usd": mcap, "vol24_usd": vol24,
+        "url": url, "logo_hint": info.get("imageUrl") or base.get("logo") or "",
+        "tw_url": tw_url_final,
+        "tw_handle": x_handle,
+        "axiom": AXIOM_WEB_URL.format(pair=pair) if pair else "https://axiom.trade/",
+        "gmgn": GMGN_WEB_URL.format(mint=token) if token else "https://gmgn.ai/",
+    }
 
 # -----------------------------------------------------------------------------
 # First-seen & tracking
 # -----------------------------------------------------------------------------
+# FIRST_SEEN_FILE is a JSONL log keyed by mint; flushes append only the tokens that changed
+_FIRST_SEEN_LOG_LEN = 0
+
 def _load_first_seen():
-    p=pathlib.Path(FIRST_SEEN_FILE)
-    if p.exists():
-        try: return json.loads(p.read_text())
-        except: return {}
-    return {}
+    global _FIRST_SEEN_LOG_LEN
+    try:
+        d, _FIRST_SEEN_LOG_LEN = _jsonl_load(FIRST_SEEN_FILE)
+        return d
+    except Exception: return {}
 def _save_first_seen(d):
+    """Compact FIRST_SEEN_FILE into a snapshot of d"""
+    global _FIRST_SEEN_LOG_LEN
     try:
-        pathlib.Path(FIRST_SEEN_FILE).parent.mkdir(parents=True, exist_ok=True)
-        pathlib.Path(FIRST_SEEN_FILE).write_text(json.dumps(d, indent=2))
+        _jsonl_compact(FIRST_SEEN_FILE, d)
+        _FIRST_SEEN_LOG_LEN = len(d)
     except Exception as e:
         log.error("save first_seen failed: %r", e)
+def _append_first_seen(d, tokens) -> None:
+    global _FIRST_SEEN_LOG_LEN
+    try:
+        _FIRST_SEEN_LOG_LEN += _jsonl_append(FIRST_SEEN_FILE, [(t, d.get(t)) for t in tokens])
+    except Exception as e:
+        log.error("append first_seen failed: %r", e)
+    if _FIRST_SEEN_LOG_LEN > max(64, 2 * len(d)):
+        _save_first_seen(d)
 
 FIRST_SEEN = _load_first_seen()
+_FIRST_SEEN_DIRTY: Set[str] = set()
+_FIRST_SEEN_LOCK = asyncio.Lock()
 TRACKED: Set[str] = set()
 LAST_PINNED: Dict[Tuple[int, str], int] = {}
 
@@ -753,7 +1274,7 @@ def decorate_with_first_seen(pairs):
     as the baseline. This is what appears as "Current Mcap" in fire emoji detection,
     and it should be used as "First Mcap" in all subsequent ice emoji updates.
     """
-    changed=False; now_ts=int(time.time())
+    changed: Set[str] = set(); now_ts=int(time.time())
     for m in pairs:
         tok = m.get("token") or ""
         rec = FIRST_SEEN.get(tok)
@@ -765,7 +1286,7 @@ def decorate_with_first_seen(pairs):
             cur_mcap = float(m.get("mcap_usd") or 0)
             cur_price = float(m.get("price_usd") or 0)
             
-            log.info(f"[Detection] NEW token {tok[:8]}... Storing baseline at ${cur_mcap:,.0f} (price: ${cur_price:.8f})")
+            log.debug("[Detection] NEW token %s... Storing baseline at $%.0f (price: $%.8f)", tok[:8], cur_mcap, cur_price)
             
             FIRST_SEEN[tok] = {
                 "first": cur_mcap,  # ← FIXED: Store current mcap as baseline
@@ -779,8 +1300,8 @@ def decorate_with_first_seen(pairs):
             # This ensures "First Mcap" shows the same value as "Current Mcap"
             m["first_mcap_usd"] = cur_mcap
             
-            log.info(f"[Detection] ✅ SAVED baseline to FIRST_SEEN: ${cur_mcap:,.0f}")
-            changed=True
+            log.debug("[Detection] ✅ SAVED baseline to FIRST_SEEN: $%.0f", cur_mcap)
+            changed.add(tok)
         else:
             # Existing token: NEVER overwrite the baseline "first" value
             # Only update Twitter data if missing
@@ -790,42 +1311,69 @@ def decorate_with_first_seen(pairs):
             # The baseline should be locked from the initial fire detection
             existing_baseline = float(rec.get("first", 0))
             if existing_baseline > 0:
-                log.info(f"[Detection] {tok[:8]}... Using EXISTING baseline: ${existing_baseline:,.0f}")
+                log.debug("[Detection] %s... Using EXISTING baseline: $%.0f", tok[:8], existing_baseline)
             else:
                 # Only set if it was somehow 0 (shouldn't happen)
                 rec["first"] = cur_mcap
-                changed = True
+                changed.add(tok)
                 log.warning(f"[Detection] {tok[:8]}... Baseline was 0, setting to ${cur_mcap:,.0f}")
             
             if not rec.get("tw_handle") and m.get("tw_handle"):
                 rec["tw_handle"] = m.get("tw_handle")
-                changed = True
+                changed.add(tok)
             if not rec.get("tw_url") and m.get("tw_url"):
                 rec["tw_url"] = m.get("tw_url")
-                changed = True
+                changed.add(tok)
             
             # For existing tokens, load the saved baseline
             m["first_mcap_usd"] = existing_baseline
         
         m["is_first_time"]=is_new
     
-    if changed: _save_first_seen(FIRST_SEEN)
+    if changed: _mark_first_seen_dirty(*changed)
+
+def _mark_first_seen_dirty(*tokens: str) -> None:
+    """Defer writing these FIRST_SEEN entries to the next flush_first_seen() (end of tick)"""
+    _FIRST_SEEN_DIRTY.update(tokens)
+
+async def flush_first_seen() -> None:
+    """Append the FIRST_SEEN entries changed (or deleted) since the last flush, off the event loop"""
+    global _FIRST_SEEN_DIRTY
+    if not _FIRST_SEEN_DIRTY: return
+    tokens, _FIRST_SEEN_DIRTY = _FIRST_SEEN_DIRTY, set()
+    async with _FIRST_SEEN_LOCK:
+        await asyncio.to_thread(_append_first_seen, FIRST_SEEN, tokens)
+
+async def prune_state(context: ContextTypes.DEFAULT_TYPE):
+    """Drop FIRST_SEEN entries past retention, plus the TRACKED/LAST_PINNED entries that hang off them"""
+    keep_min = max(FIRST_SEEN_RETENTION_MIN, MAX_AGE_MIN, UPDATE_MAX_DURATION_MIN)
+    cutoff = time.time() - keep_min * 60
+    old = [t for t, rec in FIRST_SEEN.items() if not isinstance(rec, dict) or (rec.get("ts") or 0) < cutoff]
+    for t in old:
+        del FIRST_SEEN[t]
+    gone = set(old)
+    TRACKED.difference_update(gone)
+    for key in [k for k in LAST_PINNED if k[1] in gone]:
+        del LAST_PINNED[key]
+    if old:
+        _mark_first_seen_dirty(*old); await flush_first_seen()  # written as delete records
+    log.info(f"[tick] prune first_seen={len(FIRST_SEEN)} dropped={len(old)} tracked={len(TRACKED)} pinned={len(LAST_PINNED)}")
 
 # -----------------------------------------------------------------------------
 # Twitter Overlap Detection (Stored and shown in updates)
 # -----------------------------------------------------------------------------
-def load_my_following() -> Set[str]:
+def load_my_following() -> FrozenSet[str]:
+    """Followed handles as a frozenset; it is only ever replaced wholesale, never mutated"""
     p = pathlib.Path(MY_FOLLOWING_TXT)
-    if not p.exists(): return set()
-    out=set()
+    if not p.exists(): return frozenset()
     try:
-        for line in p.read_text(encoding="utf-8", errors="ignore").splitlines():
-            h=_normalize_handle(line)
-            if h: out.add(h)
-    except: pass
-    return out
+        # Iterate the file object so large lists never sit in memory as one string + line list
+        with open(p, encoding="utf-8", errors="ignore") as f:
+            return frozenset(h for h in map(_normalize_handle, f) if h)
+    except: return frozenset()
 
-MY_HANDLES: Set[str] = load_my_following()
+# Populated off the event loop in _startup
+MY_HANDLES: FrozenSet[str] = frozenset()
 
 def load_twitter_blacklist() -> Set[str]:
     """Load blacklisted Twitter usernames from file"""
@@ -864,8 +1412,8 @@ def load_twitter_blacklist() -> Set[str]:
 
 TWITTER_BLACKLIST: Set[str] = load_twitter_blacklist()
 
-def _save_blacklist_to_file():
-    """Save blacklist to file"""
+def _save_blacklist_to_file(names: Optional[List[str]] = None):
+    """Save blacklist to file (`names`: sorted snapshot, so this can run in a worker thread)"""
     try:
         p = pathlib.Path(TWITTER_BLACKLIST_TXT)
         p.parent.mkdir(parents=True, exist_ok=True)
@@ -876,10 +1424,11 @@ def _save_blacklist_to_file():
             "# Or edit this file manually and restart bot",
             ""
         ]
-        lines.extend(sorted(TWITTER_BLACKLIST))
+        if names is None: names = sorted(TWITTER_BLACKLIST)
+        lines.extend(names)
         
         p.write_text("\n".join(lines))
-        log.info(f"[Blacklist] Saved {len(TWITTER_BLACKLIST)} usernames to file")
+        log.info(f"[Blacklist] Saved {len(names)} usernames to file")
     except Exception as e:
         log.error(f"[Blacklist] Save failed: {e}")
 
@@ -920,6 +1469,50 @@ def format_twitter_overlap(usernames: Set[str]) -> str:
     
     return ", ".join(all_links)
 
+# Rendered auto-scrape results, keyed by the scraped username set: every subscriber's scrape
+# task for a token gets the same set, so the message is formatted once per target
+SCRAPE_RENDER_TTL_SEC = 300
+_SCRAPE_RENDER_CACHE: "OrderedDict[frozenset, Tuple[float, str, str]]" = OrderedDict()
+_SCRAPE_RENDER_MAX = 4096
+
+def _render_scrape_result(usernames: Set[str]) -> Tuple[str, str]:
+    """(scrape result message, FIRST_SEEN tw_overlap text) for a non-empty username set"""
+    key = frozenset(usernames); now = time.monotonic()
+    hit = _SCRAPE_RENDER_CACHE.get(key)
+    if hit and now - hit[0] < SCRAPE_RENDER_TTL_SEC:
+        return hit[1], hit[2]
+    
+    # Format results exactly like manual /scrape
+    # Only the alphabetical head is shown, so partial-sort instead of sorting every account
+    links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in heapq.nsmallest(30, usernames)]
+    
+    if MY_HANDLES:
+        overlap = MY_HANDLES & usernames
+        if overlap:
+            overlap_links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in heapq.nsmallest(20, overlap)]
+            message = (
+                f"✅ Found {len(usernames)} accounts\n"
+                f"🎯 {len(overlap)} match your following:\n\n"
+                + ", ".join(overlap_links)
+            )
+            if len(overlap) > 20:
+                message += f"\n\n... +{len(overlap) - 20} more matches"
+            message += f"\n\n📋 All accounts:\n" + ", ".join(links[:30])
+        else:
+            message = f"✅ Found {len(usernames)} accounts:\n\n" + ", ".join(links[:30])
+    else:
+        message = f"✅ Found {len(usernames)} accounts:\n\n" + ", ".join(links[:30])
+    
+    if len(usernames) > 50:
+        message += f"\n\n... +{len(usernames) - 50} more"
+    
+    overlap_text = format_twitter_overlap(usernames)
+    _SCRAPE_RENDER_CACHE[key] = (now, message, overlap_text)
+    _SCRAPE_RENDER_CACHE.move_to_end(key)
+    while len(_SCRAPE_RENDER_CACHE) > _SCRAPE_RENDER_MAX:
+        _SCRAPE_RENDER_CACHE.popitem(last=False)
+    return message, overlap_text
+
 async def send_auto_scrape_message(bot, chat_id: int, token: str, tw_url: str, token_name: str):
     """
     Automatically send a separate scraping message (like manual /scrape)
@@ -941,46 +1534,20 @@ async def send_auto_scrape_message(bot, chat_id: int, token: str, tw_url: str, t
         )
         
         # DO THE SCRAPING (same code as manual /scrape - proven to work!)
-        usernames = twitter_scraper.scrape_url(tw_url, use_cache=True, timeout=60)
+        usernames = await twitter_scraper.scrape_url(tw_url, use_cache=True, timeout=60)
         
         if usernames:
-            # Format results exactly like manual /scrape
-            links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in sorted(usernames)[:50]]
-            
-            if MY_HANDLES:
-                overlap = sorted(MY_HANDLES & usernames)
-                if overlap:
-                    overlap_links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in overlap[:20]]
-                    message = (
-                        f"✅ Found {len(usernames)} accounts\n"
-                        f"🎯 {len(overlap)} match your following:\n\n"
-                        + ", ".join(overlap_links)
-                    )
-                    if len(overlap) > 20:
-                        message += f"\n\n... +{len(overlap) - 20} more matches"
-                    message += f"\n\n📋 All accounts:\n" + ", ".join(links[:30])
-                else:
-                    message = f"✅ Found {len(usernames)} accounts:\n\n" + ", ".join(links[:30])
-            else:
-                message = f"✅ Found {len(usernames)} accounts:\n\n" + ", ".join(links[:30])
-            
-            if len(usernames) > 50:
-                message += f"\n\n... +{len(usernames) - 50} more"
+            message, overlap_text = _render_scrape_result(usernames)
             
             # STORE RESULTS in FIRST_SEEN for future updates
-            overlap_text = format_twitter_overlap(usernames)
             if token in FIRST_SEEN:
                 FIRST_SEEN[token]["tw_overlap"] = overlap_text
                 FIRST_SEEN[token]["tw_scraped"] = True
                 FIRST_SEEN[token]["tw_scraped_at"] = int(time.time())
                 
-                # FORCE SAVE AND VERIFY
-                _save_first_seen(FIRST_SEEN)
-                test_load = _load_first_seen()
-                if test_load.get(token, {}).get("tw_overlap") == overlap_text:
-                    log.info(f"[Twitter-Auto] ✓ SAVED & VERIFIED: {token} - {len(usernames)} accounts")
-                else:
-                    log.error(f"[Twitter-Auto] ✗ SAVE VERIFICATION FAILED for {token}!")
+                # FORCE SAVE (append failures are logged by _append_first_seen)
+                _mark_first_seen_dirty(token); await flush_first_seen()
+                log.info(f"[Twitter-Auto] ✓ SAVED: {token} - {len(usernames)} accounts")
             else:
                 log.warning(f"[Twitter-Auto] Token {token} not in FIRST_SEEN, cannot store overlap")
             
@@ -1000,7 +1567,7 @@ async def send_auto_scrape_message(bot, chat_id: int, token: str, tw_url: str, t
             if token in FIRST_SEEN:
                 FIRST_SEEN[token]["tw_overlap"] = "—"
                 FIRST_SEEN[token]["tw_scraped"] = True
-                _save_first_seen(FIRST_SEEN)
+                _mark_first_seen_dirty(token); await flush_first_seen()
             
             await bot.edit_message_text(
                 chat_id=chat_id,
@@ -1023,20 +1590,7 @@ async def send_auto_scrape_message(bot, chat_id: int, token: str, tw_url: str, t
         if token in FIRST_SEEN:
             FIRST_SEEN[token]["tw_overlap"] = "—"
             FIRST_SEEN[token]["tw_scraped"] = True
-            _save_first_seen(FIRST_SEEN)
-
-# -----------------------------------------------------------------------------
-# Best token selection
-# -----------------------------------------------------------------------------
-def best_per_token(pairs: List[dict]) -> List[dict]:
-    best_map={}
-    for p in pairs:
-        tok=p.get("token") or ""
-        if not tok: continue
-        liq=float(p.get("liquidity_usd") or 0)
-        cur=best_map.get(tok)
-        if cur is None or liq>float(cur.get("liquidity_usd") or 0): best_map[tok]=p
-    return sorted(best_map.values(), key=lambda x:float(x.get("mcap_usd") or 0), reverse=True)
+            _mark_first_seen_dirty(token); await flush_first_seen()
 
 # -----------------------------------------------------------------------------
 # UI builders
@@ -1048,16 +1602,12 @@ def link_keyboard(m: dict) -> InlineKeyboardMarkup:
     ax_url = m.get("axiom") or (AXIOM_WEB_URL.format(pair=pair) if pair else "https://axiom.trade/")
     gm_url = m.get("gmgn") or (GMGN_WEB_URL.format(mint=mint) if mint else "https://gmgn.ai/")
     x_url  = m.get("tw_url") or "https://x.com/"
-    def _norm(u: str) -> str:
-        u=(u or "").strip()
-        if u.startswith("//"): u="https:"+u
-        if not (u.startswith("http://") or u.startswith("https://")): u="https://"+u
-        return u
+    # Every URL above is non-empty, so _canon_url always returns a string here
     return InlineKeyboardMarkup([
-        [InlineKeyboardButton("Dexscreener", url=_norm(ds_url)),
-         InlineKeyboardButton("Axiom",       url=_norm(ax_url))],
-        [InlineKeyboardButton("GMGN",        url=_norm(gm_url)),
-         InlineKeyboardButton("X",           url=_norm(x_url))],
+        [InlineKeyboardButton("Dexscreener", url=_canon_url(ds_url)),
+         InlineKeyboardButton("Axiom",       url=_canon_url(ax_url))],
+        [InlineKeyboardButton("GMGN",        url=_canon_url(gm_url)),
+         InlineKeyboardButton("X",           url=_canon_url(x_url))],
     ])
 
 def _pct_str(first: float, cur: float) -> str:
@@ -1069,8 +1619,9 @@ def _pct_str(first: float, cur: float) -> str:
 def build_caption(m: dict, fb_text:str, is_update: bool) -> str:
     BLUE, BANK, XEMO = "🔵","🏦","𝕏"
     fire_or_ice = "🧊" if is_update else ("🔥" if m.get("is_first_time") else "🧊")
-    first = float(m.get("first_mcap_usd") or 0)
-    cur   = float(m.get("mcap_usd") or 0)
+    # Numeric fields arrive pre-cast from _build_pair_row / the updater, and first_mcap_usd is set by the caller
+    first = m["first_mcap_usd"]
+    cur   = m["mcap_usd"]
     
     # Emoji logic:
     # - First detection (is_first_time=True): Both blue (neutral, just detected at this price)
@@ -1092,7 +1643,7 @@ def build_caption(m: dict, fb_text:str, is_update: bool) -> str:
         pct = _pct_str(first, cur)  # Show real percentage
         first_label = f"{BANK} <b>First Mcap:</b>"
     
-    price = float(m.get("price_usd") or 0)
+    price = m["price_usd"]
     header = f"{fire_or_ice} <b>{html_escape(m['name'])}</b>"
     price_line = f"💵 <b>Price:</b> " + (f"${price:.8f}" if price < 1 else f"${price:,.4f}")
     
@@ -1128,10 +1679,12 @@ async def _send_or_photo(bot, chat_id:int, caption:str, kb, token:str, logo_hint
     msg_id = None
     
     for logo_url in cands:
+        photo = None
         try:
-            byt = _fetch_image_bytes(logo_url)
-            if byt:
-                msg = await bot.send_photo(chat_id=chat_id, photo=byt, caption=caption, reply_markup=kb, parse_mode="HTML")
+            photo = _LOGO_FILE_IDS.get(logo_url) or await _logo_bytes(logo_url)
+            if photo:
+                msg = await bot.send_photo(chat_id=chat_id, photo=photo, caption=caption, reply_markup=kb, parse_mode="HTML")
+                _remember_logo_file_id(logo_url, msg)
                 if pin:
                     try: await bot.pin_chat_message(chat_id, msg.message_id, disable_notification=True)
                     except: pass
@@ -1139,9 +1692,10 @@ async def _send_or_photo(bot, chat_id:int, caption:str, kb, token:str, logo_hint
                 break
         except BadRequest as e:
             if _is_keyboard_reject(e):
-                msg = await bot.send_photo(chat_id=chat_id, photo=byt, caption=caption, parse_mode="HTML")
+                msg = await bot.send_photo(chat_id=chat_id, photo=photo, caption=caption, parse_mode="HTML")
                 msg_id = msg.message_id
                 break
+            _LOGO_FILE_IDS.pop(logo_url, None)  # a rejected file_id falls back to the bytes next time
         except Exception:
             pass
     
@@ -1153,36 +1707,44 @@ async def _send_or_photo(bot, chat_id:int, caption:str, kb, token:str, logo_hint
             if _is_keyboard_reject(e):
                 msg = await bot.send_message(chat_id=chat_id, text=caption, parse_mode="HTML", disable_web_page_preview=True)
                 msg_id = msg.message_id
+        except RetryAfter as e:
+            log.warning(f"send to chat={chat_id} still rate limited after retries: {e}")
         except Exception as e:
             log.exception(f"send error chat={chat_id}: {e}")
             _remove_bad_sub(chat_id)
     
     return msg_id
 
+async def _copy_or_send(bot, chat_id:int, copy_from: Optional[Tuple[int, int]], caption:str, kb, token:str, logo_hint:str, pin:bool=False) -> Optional[int]:
+    if copy_from:
+        try:
+            res = await bot.copy_message(chat_id=chat_id, from_chat_id=copy_from[0], message_id=copy_from[1], reply_markup=kb)
+            if pin:
+                try: await bot.pin_chat_message(chat_id, res.message_id, disable_notification=True)
+                except: pass
+            return res.message_id
+        except Exception as e:
+            log.warning(f"copy_message to {chat_id} failed, sending fresh: {e}")
+    return await _send_or_photo(bot, chat_id, caption, kb, token, logo_hint, pin)
+
+async def _bounded_send(fn, *args, **kwargs):
+    async with _SEND_SEM:
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            log.exception(f"{fn.__name__} failed: {e}")
+
 def passes_filters_for_alert(m: dict) -> bool:
-    liq = float(m.get("liquidity_usd") or 0)
-    mcap = float(m.get("mcap_usd") or 0)
-    vol = float(m.get("vol24_usd") or 0)
-    age = float(m.get("age_min") or 0)
-    if liq < MIN_LIQ_USD: return False
-    if mcap < MIN_MCAP_USD: return False
-    if vol < MIN_VOL_H24_USD: return False
-    if age > MAX_AGE_MIN: return False
+    # Rows are built with these fields already as floats; most rejects cost one lookup
+    if m["liquidity_usd"] < MIN_LIQ_USD: return False
+    if m["mcap_usd"] < MIN_MCAP_USD: return False
+    if m["vol24_usd"] < MIN_VOL_H24_USD: return False
+    if m["age_min"] > MAX_AGE_MIN: return False
     return True
 
-async def send_new_token(bot, chat_id: int, m: dict):
-    """
-    Send new token alert immediately
-    Trigger automatic separate scraping message in background (if not already scraped)
-    
-    CLEAN SEQUENCE:
-    1. Send first detection (with fresh API data) → PIN
-    2. Trigger scraping in background (separate message)
-    3. Wait for update cycle (90s) → Shows scrape results in update
-    """
+def _render_new_token(m: dict) -> Tuple[str, InlineKeyboardMarkup]:
+    """Per-token half of a fire alert (baseline fix-up, caption, keyboard) - identical for every chat"""
     token = m.get("token")
-    key = (chat_id, token or "")
-    should_pin = key not in LAST_PINNED
     
     # Check if we already have stored Twitter data
     record = FIRST_SEEN.get(token, {})
@@ -1201,21 +1763,40 @@ async def send_new_token(bot, chat_id: int, m: dict):
     
     # VERIFY: Check what's actually stored in FIRST_SEEN
     stored_baseline = FIRST_SEEN.get(token, {}).get("first", 0)
-    log.info(f"[Fire] {token[:8]}... Fire mcap=${cur_mcap:,.0f}, Stored baseline=${stored_baseline:,.0f}")
+    log.debug("[Fire] %s... Fire mcap=$%.0f, Stored baseline=$%.0f", token[:8], cur_mcap, stored_baseline)
     
     if abs(stored_baseline - cur_mcap) > 1:  # Allow for floating point errors
         log.error(f"[Fire] ⚠️ MISMATCH! Stored baseline ${stored_baseline:,.0f} != Current mcap ${cur_mcap:,.0f}")
         log.error(f"[Fire] This means ice updates will show WRONG baseline!")
         log.error(f"[Fire] Fixing by updating FIRST_SEEN...")
         FIRST_SEEN[token]["first"] = cur_mcap
-        _save_first_seen(FIRST_SEEN)
-        log.info(f"[Fire] ✅ Fixed and saved correct baseline: ${cur_mcap:,.0f}")
+        _mark_first_seen_dirty(token)
+        log.info(f"[Fire] ✅ Fixed correct baseline: ${cur_mcap:,.0f}")
     
-    caption = build_caption(m, fb_text, is_update=False)
-    kb = link_keyboard(m)
+    return build_caption(m, fb_text, is_update=False), link_keyboard(m)
+
+async def send_new_token(bot, chat_id: int, m: dict, copy_from: Optional[Tuple[int, int]] = None,
+                         rendered: Optional[Tuple[str, InlineKeyboardMarkup]] = None) -> Optional[int]:
+    """
+    Send new token alert immediately
+    Trigger automatic separate scraping message in background (if not already scraped)
+    copy_from=(chat_id, message_id) copies an alert already sent elsewhere instead of re-uploading it
+    rendered=_render_new_token(m) lets a fan-out build the caption/keyboard once for all chats
     
-    msg_id = await _send_or_photo(
-        bot, chat_id, caption, kb,
+    CLEAN SEQUENCE:
+    1. Send first detection (with fresh API data) → PIN
+    2. Trigger scraping in background (separate message)
+    3. Wait for update cycle (90s) → Shows scrape results in update
+    """
+    token = m.get("token")
+    key = (chat_id, token or "")
+    should_pin = key not in LAST_PINNED
+    record = FIRST_SEEN.get(token, {})
+    
+    caption, kb = rendered or _render_new_token(m)
+    
+    msg_id = await _copy_or_send(
+        bot, chat_id, copy_from, caption, kb,
         token=m.get("token"),
         logo_hint=m.get("logo_hint"),
         pin=should_pin
@@ -1223,7 +1804,7 @@ async def send_new_token(bot, chat_id: int, m: dict):
     
     if should_pin and msg_id:
         LAST_PINNED[key] = msg_id
-        log.info(f"[Pin] ✅ Pinned message {msg_id} for {token[:8]}...")
+        log.debug("[Pin] ✅ Pinned message %s for %s...", msg_id, token[:8])
     
     # Only scrape if NOT already scraped
     tw_url = m.get("tw_url")
@@ -1243,85 +1824,94 @@ async def send_new_token(bot, chat_id: int, m: dict):
         BACKGROUND_TASKS.add(task)
         task.add_done_callback(BACKGROUND_TASKS.discard)
         
-        log.info(f"[Alert] Sent alert for {m.get('name')} + triggered auto-scrape")
+        log.debug("[Alert] Sent alert for %s to %s + triggered auto-scrape", m.get("name"), chat_id)
     elif already_scraped:
-        log.info(f"[Alert] Sent alert for {m.get('name')} (already scraped, showing stored data)")
+        log.debug("[Alert] Sent alert for %s to %s (already scraped, showing stored data)", m.get("name"), chat_id)
     else:
-        log.info(f"[Alert] Sent alert for {m.get('name')} (no Twitter URL to scrape)")
+        log.debug("[Alert] Sent alert for %s to %s (no Twitter URL to scrape)", m.get("name"), chat_id)
     
     # ========== MULTI-USER TRADING TRIGGER ==========
+    # Runs in the background so the alert fan-out isn't held up by the scrape wait
     if MULTIUSER_ENABLED and session_manager:
-        try:
-            # Wait for Twitter scraping to complete
-            await asyncio.sleep(3)
-            
-            # Get latest Twitter data
-            record = FIRST_SEEN.get(token, {})
-            tw_overlap = record.get("tw_overlap", "—")
-            bullseye_count = tw_overlap.count('🎯')
-            
-            # Get all active users
-            active_users = session_manager.get_active_users()
-            
-            if not active_users:
-                log.info(f"[MultiUser] No active users for {m.get('name')}")
-            else:
-                log.info(f"[MultiUser] Checking {m.get('name')} for {len(active_users)} active users")
-            
-            # Check each active user
-            for user_telegram_id, user_data in active_users.items():
-                try:
-                    settings = user_data['settings']
-                    balance = user_data['balance']
-                    trade_amount = settings['trade_amount_sol']
-                    min_bullseye = settings['bullseye_min']
-                    
-                    # Check if user can trade this token
-                    if balance < trade_amount:
-                        log.info(f"[MultiUser] User {user_telegram_id} skipped (low balance: {balance:.4f})")
-                        continue
-                    
-                    if bullseye_count < min_bullseye:
-                        log.info(f"[MultiUser] User {user_telegram_id} skipped (bullseye {bullseye_count} < {min_bullseye})")
-                        continue
-                    
-                    # Criteria met! Notify user
-                    log.info(f"[MultiUser] 🤖 Trading for user {user_telegram_id}: {m.get('name')} ({bullseye_count}🎯)")
-                    
-                    await bot.send_message(
-                        chat_id=user_telegram_id,
-                        text=(
-                            f"🤖 **Auto Trade Triggered!**\n\n"
-                            f"**Token:** {m.get('name')}\n"
-                            f"**Bullseye:** {bullseye_count}🎯\n"
-                            f"**Amount:** {trade_amount} SOL\n\n"
-                            f"⏳ Executing trade...\n\n"
-                            f"_Note: Actual trade execution coming soon!_\n"
-                            f"_For now, this is a notification that criteria were met._"
-                        ),
-                        parse_mode='Markdown'
-                    )
-                    
-                    # Add position tracking (placeholder)
-                    session_manager.add_position(user_telegram_id, token, {
-                        'name': m.get('name'),
-                        'entry_price': m.get('price_usd', 0),
-                        'entry_mcap': m.get('mcap_usd', 0),
-                        'amount_sol': trade_amount,
-                        'bullseye_count': bullseye_count,
-                        'timestamp': time.time()
-                    })
-                    
-                except Exception as e:
-                    log.error(f"[MultiUser] Error trading for user {user_telegram_id}: {e}")
-            
-        except Exception as e:
-            log.error(f"[MultiUser] Trading trigger error: {e}")
+        task = asyncio.create_task(_multiuser_trade_trigger(bot, m, token))
+        BACKGROUND_TASKS.add(task)
+        task.add_done_callback(BACKGROUND_TASKS.discard)
     # ========== END MULTI-USER TRADING TRIGGER ==========
+    
+    return msg_id
+
+async def _multiuser_trade_trigger(bot, m: dict, token: str):
+    """Notify active multi-user traders whose criteria this token meets"""
+    try:
+        # Wait for Twitter scraping to complete
+        await asyncio.sleep(3)
+        
+        # Get latest Twitter data
+        record = FIRST_SEEN.get(token, {})
+        tw_overlap = record.get("tw_overlap", "—")
+        bullseye_count = tw_overlap.count('🎯')
+        
+        # Get all active users
+        active_users = session_manager.get_active_users()
+        
+        if not active_users:
+            log.info(f"[MultiUser] No active users for {m.get('name')}")
+        else:
+            log.info(f"[MultiUser] Checking {m.get('name')} for {len(active_users)} active users")
+        
+        # Check each active user
+        for user_telegram_id, user_data in active_users.items():
+            try:
+                settings = user_data['settings']
+                balance = user_data['balance']
+                trade_amount = settings['trade_amount_sol']
+                min_bullseye = settings['bullseye_min']
+                
+                # Check if user can trade this token
+                if balance < trade_amount:
+                    log.info(f"[MultiUser] User {user_telegram_id} skipped (low balance: {balance:.4f})")
+                    continue
+                
+                if bullseye_count < min_bullseye:
+                    log.info(f"[MultiUser] User {user_telegram_id} skipped (bullseye {bullseye_count} < {min_bullseye})")
+                    continue
+                
+                # Criteria met! Notify user
+                log.info(f"[MultiUser] 🤖 Trading for user {user_telegram_id}: {m.get('name')} ({bullseye_count}🎯)")
+                
+                await bot.send_message(
+                    chat_id=user_telegram_id,
+                    text=(
+                        f"🤖 **Auto Trade Triggered!**\n\n"
+                        f"**Token:** {m.get('name')}\n"
+                        f"**Bullseye:** {bullseye_count}🎯\n"
+                        f"**Amount:** {trade_amount} SOL\n\n"
+                        f"⏳ Executing trade...\n\n"
+                        f"_Note: Actual trade execution coming soon!_\n"
+                        f"_For now, this is a notification that criteria were met._"
+                    ),
+                    parse_mode='Markdown'
+                )
+                
+                # Add position tracking (placeholder)
+                session_manager.add_position(user_telegram_id, token, {
+                    'name': m.get('name'),
+                    'entry_price': m.get('price_usd', 0),
+                    'entry_mcap': m.get('mcap_usd', 0),
+                    'amount_sol': trade_amount,
+                    'bullseye_count': bullseye_count,
+                    'timestamp': time.time()
+                })
+                
+            except Exception as e:
+                log.error(f"[MultiUser] Error trading for user {user_telegram_id}: {e}")
+        
+    except Exception as e:
+        log.error(f"[MultiUser] Trading trigger error: {e}")
 
-async def send_price_update(bot, chat_id: int, m: dict):
+def _render_price_update(m: dict) -> Tuple[str, InlineKeyboardMarkup]:
     """
-    Send price update for tracked token
+    Per-token half of a price update (caption, keyboard) - identical for every chat
     
     CRITICAL: Must load saved baseline from FIRST_SEEN, NOT use API's first_mcap_usd
     """
@@ -1335,7 +1925,7 @@ async def send_price_update(bot, chat_id: int, m: dict):
     # The API returns onchain price ($78k), but we want detection price ($134k)
     if saved_baseline > 0:
         m["first_mcap_usd"] = saved_baseline
-        log.info(f"[Update] {token[:8]}... Using saved baseline: ${saved_baseline:,.0f}")
+        log.debug("[Update] %s... Using saved baseline: $%.0f", token[:8], saved_baseline)
     else:
         # Fallback if no saved baseline (shouldn't happen)
         log.warning(f"[Update] {token[:8]}... No saved baseline, using API value")
@@ -1355,71 +1945,114 @@ async def send_price_update(bot, chat_id: int, m: dict):
     
     # Check if we have scraped data
     if first_rec.get("tw_scraped"):
-        log.info(f"[Update] {m.get('name')} - Using stored Twitter data: {fb_text}")
+        log.debug("[Update] %s - Using stored Twitter data: %s", m.get("name"), fb_text)
     else:
-        log.warning(f"[Update] {m.get('name')} - No Twitter data available")
+        log.debug("[Update] %s - No Twitter data available", m.get("name"))
     
     m["_is_update"] = True
     m["is_first_time"] = False  # Make sure it's marked as update
     
-    caption = build_caption(m, fb_text, is_update=True)
-    kb = link_keyboard(m)
+    return build_caption(m, fb_text, is_update=True), link_keyboard(m)
+
+async def send_price_update(bot, chat_id: int, m: dict, rendered: Optional[Tuple[str, InlineKeyboardMarkup]] = None) -> Optional[int]:
+    """Send price update for tracked token (rendered=_render_price_update(m) to reuse across chats); returns the message id"""
+    caption, kb = rendered or _render_price_update(m)
     
-    await _send_or_photo(
+    return await _send_or_photo(
         bot, chat_id, caption, kb,
         token=m.get("token"),
         logo_hint=m.get("logo_hint"),
         pin=False
     )
 
+COPY_SOURCE_TRIES = 3  # chats tried in turn for the one real upload before everyone gets a plain send
+
+def _copy_source_order(subs) -> List[int]:
+    """Candidates for the upload that alerts are copied from: ALERT_CHAT_ID, then private chats
+    (positive ids) ahead of groups, which Bot API throttles to 20 messages/min"""
+    return heapq.nsmallest(COPY_SOURCE_TRIES, subs, key=lambda cid: (cid != ALERT_CHAT_ID, cid < 0))
+
 async def do_trade_push(bot):
     try:
-        pairs = best_per_token(_pairs_from_mirror())
+        pairs = _pairs_from_mirror()
         decorate_with_first_seen(pairs)
+        subs = _subs_view()
         if not pairs and NO_MATCH_PING:
-            for chat_id in list(SUBS):
-                await bot.send_message(chat_id=chat_id, text="(auto /trade) no matches right now.", disable_web_page_preview=True)
+            await asyncio.gather(*(
+                _bounded_send(bot.send_message, chat_id=chat_id, text="(auto /trade) no matches right now.", disable_web_page_preview=True)
+                for chat_id in subs
+            ))
+            log.info(f"[tick] auto_trade pairs=0 subs={len(subs)}")
             return
-        for chat_id in list(SUBS):
-            sent=0
-            for m in pairs:
-                if TOP_N_PER_TICK > 0 and sent >= TOP_N_PER_TICK: break
-                if not passes_filters_for_alert(m): continue
-                already_tracked = m["token"] in TRACKED
-                TRACKED.add(m["token"])
-                if m.get("is_first_time") or not already_tracked:
-                    await send_new_token(bot, chat_id, m); sent += 1
-                await asyncio.sleep(0.05)
+        if not subs:
+            log.info(f"[tick] auto_trade pairs={len(pairs)} subs=0")
+            return
+        # Every subscriber gets the same alerts, so pick them once and fan out per token
+        fresh=[]
+        for m in pairs:
+            if TOP_N_PER_TICK > 0 and len(fresh) >= TOP_N_PER_TICK: break
+            if not passes_filters_for_alert(m): continue
+            already_tracked = m["token"] in TRACKED
+            TRACKED.add(m["token"])
+            if m.get("is_first_time") or not already_tracked:
+                fresh.append(m)
+        sent = 0
+        sources = _copy_source_order(subs) if fresh else []
+        for m in fresh:
+            # Render and upload once, then let Telegram copy it server-side to everyone else;
+            # if the upload fails, the next candidate chat gets a go before falling back to plain sends
+            rendered = _render_new_token(m)
+            src = None; tried = set()
+            for chat_id in sources:
+                tried.add(chat_id)
+                msg_id = await _bounded_send(send_new_token, bot, chat_id, m, rendered=rendered)
+                if msg_id:
+                    src = (chat_id, msg_id); sent += 1
+                    break
+            res = await asyncio.gather(*(_bounded_send(send_new_token, bot, chat_id, m, copy_from=src, rendered=rendered)
+                                         for chat_id in subs if chat_id not in tried))
+            sent += sum(1 for x in res if x)
+        log.info(f"[tick] auto_trade pairs={len(pairs)} fresh={len(fresh)} subs={len(subs)} sent={sent}/{len(fresh) * len(subs)}")
     except Exception as e:
         log.exception(f"do_trade_push error: {e}")
+    finally:
+        # Persist the baselines decorate_with_first_seen recorded, including on the no-pairs/no-subs returns
+        await flush_first_seen()
 
 async def auto_trade(context: ContextTypes.DEFAULT_TYPE):
-    log.info(f"🔥 [tick] auto_trade fired (interval={TRADE_SUMMARY_SEC}s)")
+    log.debug("🔥 [tick] auto_trade fired (interval=%ss)", TRADE_SUMMARY_SEC)
     await do_trade_push(context.bot)
 
 async def updater(context: ContextTypes.DEFAULT_TYPE):
-    global FIRST_SEEN
-    log.info(f"🧊 [tick] updater fired (interval={UPDATE_INTERVAL_SEC}s)")
+    log.debug("🧊 [tick] updater fired (interval=%ss)", UPDATE_INTERVAL_SEC)
     try:
+        # FIRST_SEEN in memory is authoritative (every writer goes through it); just persist pending changes,
+        # even on ticks with nothing tracked
+        await flush_first_seen()
         if not TRACKED: return
         
-        # Reload FIRST_SEEN to get latest scraped data
-        FIRST_SEEN = _load_first_seen()
-        
-        now_ts=int(time.time())
-        log.info(f"[updater] refreshing {len(TRACKED)} tracked tokens")
+        # One clock read per tick: expiry and every row's age_min use the same instant
+        now=time.time(); now_ts=int(now); now_ms=now*1000.0
+        tracked = len(TRACKED); updated = expired = 0
+        live = []
         for token in list(TRACKED):
-            first_rec = FIRST_SEEN.get(token) or {}
-            first_ts = int(first_rec.get("ts", now_ts))
+            first_ts = int((FIRST_SEEN.get(token) or {}).get("ts", now_ts))
             if now_ts - first_ts >= UPDATE_MAX_DURATION_MIN * 60:
-                TRACKED.discard(token); continue
-            cur=_best_pool_for_mint(CHAIN_ID, token)
+                TRACKED.discard(token); expired += 1; continue
+            live.append(token)
+        pools = await _best_pools_for_mints(CHAIN_ID, live)
+        subs = _subs_view()  # one snapshot per tick; sub changes apply from the next tick
+        for token in live:
+            first_rec = FIRST_SEEN.get(token) or {}
+            cur = pools.get(token)
             if not cur: continue
             base=cur.get("baseToken") or {}; info=cur.get("info") or {}
+            pair=cur.get("pairAddress") or ""; fdv=cur.get("fdv")
             
             stored_tw_handle = first_rec.get("tw_handle")
             stored_tw_url = first_rec.get("tw_url")
-            fresh_tw_handle, fresh_tw_url = _extract_x(info)
+            # Stored values win, so the socials only need parsing when one is missing
+            fresh_tw_handle, fresh_tw_url = (None, None) if (stored_tw_handle and stored_tw_url) else _extract_x(info)
             
             final_tw_handle = stored_tw_handle or fresh_tw_handle
             final_tw_url = stored_tw_url or fresh_tw_url
@@ -1431,31 +2064,32 @@ async def updater(context: ContextTypes.DEFAULT_TYPE):
             m = {
                 "name": base.get("symbol") or base.get("name") or "Unknown",
                 "token": base.get("address") or token,
-                "pair": cur.get("pairAddress") or "",
+                "pair": pair,
                 "price_usd": _get_price_usd(cur),
                 "liquidity_usd": float((cur.get("liquidity") or {}).get("usd",0) or 0),
-                "mcap_usd": float((cur.get("fdv") if cur.get("fdv") is not None else (cur.get("marketCap") or 0)) or 0),
+                "mcap_usd": float((fdv if fdv is not None else (cur.get("marketCap") or 0)) or 0),
                 "vol24_usd": float((cur.get("volume") or {}).get("h24",0) or 0),
-                "age_min": _pair_age_minutes(time.time()*1000.0, cur.get("pairCreatedAt")),
+                "age_min": _pair_age_minutes(now_ms, cur.get("pairCreatedAt")),
                 "url": _valid_url(cur.get("url") or ""),
                 "logo_hint": info.get("imageUrl") or base.get("logo") or "",
                 "tw_handle": final_tw_handle,
                 "tw_url": final_tw_url,
-                "axiom": AXIOM_WEB_URL.format(pair=cur.get("pairAddress") or "") if cur.get("pairAddress") else "https://axiom.trade/",
+                "axiom": AXIOM_WEB_URL.format(pair=pair) if pair else "https://axiom.trade/",
                 "gmgn": GMGN_WEB_URL.format(mint=token) if token else "https://gmgn.ai/",
             }
             
             # CRITICAL: Add stored Twitter overlap to update dict!
             m["tw_overlap"] = first_rec.get("tw_overlap", "—")
             
-            if float(m.get("age_min", 1e9)) >= MAX_AGE_MIN:
-                TRACKED.discard(token); continue
+            if m["age_min"] >= MAX_AGE_MIN:
+                TRACKED.discard(token); expired += 1; continue
             m["first_mcap_usd"] = float(first_rec.get("first", 0.0))
             m["is_first_time"]  = False
-            for chat_id in list(SUBS):
-                if passes_filters_for_alert(m):
-                    await send_price_update(context.bot, chat_id, m)
-                    await asyncio.sleep(0.02)
+            if not passes_filters_for_alert(m): continue
+            rendered = _render_price_update(m)
+            await asyncio.gather(*(_bounded_send(send_price_update, context.bot, chat_id, m, rendered=rendered) for chat_id in subs))
+            updated += 1
+        log.info(f"[tick] updater tracked={tracked} updated={updated} expired={expired}")
     except Exception as e:
         log.exception(f"updater job error: {e}")
 
@@ -1463,9 +2097,7 @@ async def updater(context: ContextTypes.DEFAULT_TYPE):
 # Bot commands
 # -----------------------------------------------------------------------------
 async def cmd_start(u: Update, c: ContextTypes.DEFAULT_TYPE):
-    global SUBS
-    SUBS.add(u.effective_chat.id)
-    _save_subs_to_file()
+    _add_sub(u.effective_chat.id)
     
     multiuser_status = "✅ Enabled" if MULTIUSER_ENABLED else "❌ Not installed"
     
@@ -1529,15 +2161,11 @@ async def cmd_id(u: Update, c: ContextTypes.DEFAULT_TYPE):
     await u.message.reply_text(str(u.effective_chat.id))
 
 async def cmd_sub(u: Update, c: ContextTypes.DEFAULT_TYPE):
-    global SUBS
-    SUBS.add(u.effective_chat.id)
-    _save_subs_to_file()
+    _add_sub(u.effective_chat.id)
     await u.message.reply_text("✅ Subscribed.")
 
 async def cmd_unsub(u: Update, c: ContextTypes.DEFAULT_TYPE):
-    global SUBS
-    SUBS.discard(u.effective_chat.id)
-    _save_subs_to_file()
+    _discard_sub(u.effective_chat.id)
     await u.message.reply_text("❎ Unsubscribed.")
 
 async def cmd_status(u: Update, c: ContextTypes.DEFAULT_TYPE):
@@ -1578,28 +2206,25 @@ async def cmd_trade(u: Update, c: ContextTypes.DEFAULT_TYPE):
         except:
             manual_cap = None
     pairs = _pairs_from_mirror()
-    pairs = best_per_token(pairs)
     decorate_with_first_seen(pairs)
     cap = manual_cap if manual_cap is not None else (TOP_N_PER_TICK if TOP_N_PER_TICK > 0 else 10)
-    sent = 0
-    for m in pairs:
-        if not passes_filters_for_alert(m):
-            continue
-        TRACKED.add(m["token"])
-        if m.get("is_first_time"):
-            await send_new_token(c.bot, u.effective_chat.id, m)
-        else:
-            await send_price_update(c.bot, u.effective_chat.id, m)
-        sent += 1
-        if sent >= cap:
-            break
-        await asyncio.sleep(0.05)
+    # Stop filtering once cap matches are found instead of filtering the whole mirror and slicing
+    picked = list(islice((m for m in pairs if passes_filters_for_alert(m)), cap))
+    TRACKED.update(m["token"] for m in picked)
+    # Sent concurrently under the shared send semaphore rather than one by one with a sleep
+    res = await asyncio.gather(*(_bounded_send(send_new_token if m.get("is_first_time") else send_price_update,
+                                               c.bot, u.effective_chat.id, m) for m in picked))
+    sent = len(picked)
+    failed = sum(1 for x in res if not x)  # _bounded_send returns None when a send fails
+    await flush_first_seen()
     if sent == 0:
         await u.message.reply_text("(trade) no matches with current filters.")
+    elif failed:
+        await u.message.reply_text(f"(trade) {failed}/{sent} matches failed to send.")
 
 async def cmd_mirror(u: Update, c: ContextTypes.DEFAULT_TYPE):
     s = mirror_stats()
-    await u.message.reply_text(json.dumps(s, indent=2))
+    await u.message.reply_text(orjson.dumps(s, option=orjson.OPT_INDENT_2).decode())
 
 async def cmd_scrape(u: Update, c: ContextTypes.DEFAULT_TYPE):
     """Manual Twitter scrape command: /scrape <twitter_url>"""
@@ -1625,17 +2250,17 @@ async def cmd_scrape(u: Update, c: ContextTypes.DEFAULT_TYPE):
     
     try:
         # Force refresh (don't use cache) for manual scrapes
-        usernames = twitter_scraper.scrape_url(url, use_cache=False, timeout=60)
+        usernames = await twitter_scraper.scrape_url(url, use_cache=False, timeout=60)
         
         if usernames:
             # Show up to 50 usernames with clickable links
-            links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in sorted(usernames)[:50]]
+            links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in heapq.nsmallest(50, usernames)]
             
             # Show overlap with MY_HANDLES if available
             if MY_HANDLES:
-                overlap = sorted(MY_HANDLES & usernames)
+                overlap = MY_HANDLES & usernames
                 if overlap:
-                    overlap_links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in overlap[:20]]
+                    overlap_links = [f'<a href="https://x.com/{h}">@{h}</a>' for h in heapq.nsmallest(20, overlap)]
                     message = (
                         f"✅ Found {len(usernames)} accounts\n"
                         f"🎯 {len(overlap)} match your following:\n\n"
@@ -1669,7 +2294,7 @@ async def cmd_clearcache(u: Update, c: ContextTypes.DEFAULT_TYPE):
     """Clear Twitter cache"""
     count = len(twitter_scraper.cache)
     twitter_scraper.cache.clear()
-    twitter_scraper._save_cache()
+    await twitter_scraper.persist_cache()
     await u.message.reply_text(f"🗑️ Cleared {count} cached Twitter results")
 
 async def cmd_blacklist(u: Update, c: ContextTypes.DEFAULT_TYPE):
@@ -1688,7 +2313,7 @@ async def cmd_blacklist(u: Update, c: ContextTypes.DEFAULT_TYPE):
                 "/blacklist clear"
             )
         else:
-            blacklist_str = ", ".join(f"@{h}" for h in sorted(TWITTER_BLACKLIST)[:50])
+            blacklist_str = ", ".join(f"@{h}" for h in heapq.nsmallest(50, TWITTER_BLACKLIST))
             if len(TWITTER_BLACKLIST) > 50:
                 blacklist_str += f" ... +{len(TWITTER_BLACKLIST) - 50} more"
             await u.message.reply_text(
@@ -1719,11 +2344,12 @@ async def cmd_blacklist(u: Update, c: ContextTypes.DEFAULT_TYPE):
             return
         
         TWITTER_BLACKLIST.add(username)
-        _save_blacklist_to_file()
+        await asyncio.to_thread(_save_blacklist_to_file, sorted(TWITTER_BLACKLIST))
         
         # Clear cache so future scrapes apply the blacklist
         twitter_scraper.cache.clear()
-        twitter_scraper._save_cache()
+        _SCRAPE_RENDER_CACHE.clear()
+        await twitter_scraper.persist_cache()
         
         await u.message.reply_text(
             f"✅ Added to blacklist: @{username}\n"
@@ -1747,11 +2373,12 @@ async def cmd_blacklist(u: Update, c: ContextTypes.DEFAULT_TYPE):
             return
         
         TWITTER_BLACKLIST.remove(username)
-        _save_blacklist_to_file()
+        await asyncio.to_thread(_save_blacklist_to_file, sorted(TWITTER_BLACKLIST))
         
         # Clear cache so future scrapes include the user again
         twitter_scraper.cache.clear()
-        twitter_scraper._save_cache()
+        _SCRAPE_RENDER_CACHE.clear()
+        await twitter_scraper.persist_cache()
         
         await u.message.reply_text(
             f"✅ Removed from blacklist: @{username}\n"
@@ -1767,11 +2394,12 @@ async def cmd_blacklist(u: Update, c: ContextTypes.DEFAULT_TYPE):
         
         count = len(TWITTER_BLACKLIST)
         TWITTER_BLACKLIST.clear()
-        _save_blacklist_to_file()
+        await asyncio.to_thread(_save_blacklist_to_file, sorted(TWITTER_BLACKLIST))
         
         # Clear cache
         twitter_scraper.cache.clear()
-        twitter_scraper._save_cache()
+        _SCRAPE_RENDER_CACHE.clear()
+        await twitter_scraper.persist_cache()
         
         await u.message.reply_text(
             f"🗑️ Cleared {count} usernames from blacklist\n"
@@ -1804,23 +2432,24 @@ async def cmd_testreaders(u: Update, c: ContextTypes.DEFAULT_TYPE):
             else:
                 fetch_url = service['url'] + test_url
             
-            response = SESSION.get(fetch_url, headers=HEADERS, timeout=10)
+            async with _http().get(fetch_url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                text = await response.text(errors="replace")
             
-            if response.status_code == 200 and len(response.text) > 500:
-                results.append(f"✅ {service['name']}: Working ({len(response.text):,} chars)")
+            if response.status == 200 and len(text) > 500:
+                results.append(f"✅ {service['name']}: Working ({len(text):,} chars)")
                 log.info(f"[Test] ✅ {service['name']} PASSED")
             else:
-                results.append(f"❌ {service['name']}: Status {response.status_code}, {len(response.text)} chars")
-                log.warning(f"[Test] ❌ {service['name']} FAILED: {response.status_code}")
+                results.append(f"❌ {service['name']}: Status {response.status}, {len(text)} chars")
+                log.warning(f"[Test] ❌ {service['name']} FAILED: {response.status}")
                 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             results.append(f"⏱️ {service['name']}: Timeout (>10s)")
             log.warning(f"[Test] ⏱️ {service['name']} TIMEOUT")
         except Exception as e:
             results.append(f"❌ {service['name']}: {type(e).__name__}")
             log.warning(f"[Test] ❌ {service['name']} ERROR: {e}")
         
-        time.sleep(1)  # Be nice, don't hammer
+        await asyncio.sleep(1)  # Be nice, don't hammer
     
     working = sum(1 for r in results if r.startswith("✅"))
     
@@ -1859,7 +2488,7 @@ async def cmd_resettoken(u: Update, c: ContextTypes.DEFAULT_TYPE):
     
     old_first = FIRST_SEEN[token].get("first", 0)
     del FIRST_SEEN[token]
-    _save_first_seen(FIRST_SEEN)
+    _mark_first_seen_dirty(token); await flush_first_seen()
     
     await u.message.reply_text(
         f"✅ Reset token data\n\n"
@@ -1870,21 +2499,25 @@ async def cmd_resettoken(u: Update, c: ContextTypes.DEFAULT_TYPE):
 
 async def _post_init(app: Application):
     global SUBS, MY_HANDLES, TWITTER_BLACKLIST
-    SUBS = _load_subs_from_file()
-    MY_HANDLES = load_my_following()
-    TWITTER_BLACKLIST = load_twitter_blacklist()
+    SUBS = await asyncio.to_thread(_load_subs_from_file)
+    MY_HANDLES = await asyncio.to_thread(load_my_following)
+    TWITTER_BLACKLIST = await asyncio.to_thread(load_twitter_blacklist)
+    _invalidate_subs_view()
     if ALERT_CHAT_ID:
-        SUBS.add(ALERT_CHAT_ID)
-        _save_subs_to_file()
+        _add_sub(ALERT_CHAT_ID)  # appended, so a file that failed to load isn't overwritten
     await _validate_subs(app.bot)
-    log.info(f"Subscribers: {sorted(SUBS)}")
+    log.info(f"Subscribers: {_subs_view().tolist()}")
     log.info(f"Following: {len(MY_HANDLES)} handles")
     log.info(f"Blacklist: {len(TWITTER_BLACKLIST)} usernames")
     log.info(f"Twitter scraper: {'Enabled (Auto separate messages mode)' if TWITTER_SCRAPER_ENABLED else 'Disabled'}")
     log.info(f"Detection speed: ⚡ Every {TRADE_SUMMARY_SEC}s (optimized)")
     log.info(f"Price tracking: Fresh API data on first detection (accurate baseline)")
 
-application = Application.builder().token(TG).post_init(_post_init).build()
+# Every Bot API call goes through the limiter: TG_SEND_RPS overall, 20/min per group chat, and on a
+# 429 all calls pause for retry_after before retrying (up to TG_SEND_RETRIES) instead of failing
+application = (Application.builder().token(TG).http_version(TG_HTTP_VERSION)
+               .rate_limiter(AIORateLimiter(overall_max_rate=TG_SEND_RPS, max_retries=TG_SEND_RETRIES))
+               .post_init(_post_init).build())
 application.add_handler(CommandHandler("start", cmd_start))
 application.add_handler(CommandHandler("id", cmd_id))
 application.add_handler(CommandHandler("subscribe", cmd_sub))
@@ -1914,8 +2547,9 @@ else:
     log.info("⚠️  Multi-user commands not available - upload session wallet files")
 # ========== END MULTI-USER SESSION WALLET COMMANDS ==========
 
-app = FastAPI(title="Telegram Webhook")
-app.add_middleware(GZipMiddleware, minimum_size=512)
+app = FastAPI(title="Telegram Webhook", default_response_class=ORJSONResponse)
+# Responses are small JSON (health, webhook acks): only compress real payloads, at a cheap level
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 @app.get("/")
 async def health_root():
@@ -1942,11 +2576,23 @@ async def healthz():
 @app.on_event("startup")
 async def _startup():
     global SUBS, FIRST_SEEN, MIRROR, MY_HANDLES, TWITTER_BLACKLIST
-    SUBS = _load_subs_from_file()
-    FIRST_SEEN = _load_first_seen()
-    MIRROR = _mirror_load()
-    MY_HANDLES = load_my_following()
-    TWITTER_BLACKLIST = load_twitter_blacklist()
+    # uvicorn's default --loop auto picks uvloop when installed (requirements.txt); log which one we got
+    log.info(f"[startup] event loop: {type(asyncio.get_running_loop()).__module__}")
+    if sys.version_info >= (3, 12):
+        # Tasks that finish before their first real suspension (cache hits, quick saves) skip the scheduler
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    SUBS = await asyncio.to_thread(_load_subs_from_file)
+    _invalidate_subs_view()
+    # Compact once per boot; skipped (returns False) if the load failed or came back empty
+    await asyncio.to_thread(_save_subs_to_file, _subs_view())
+    FIRST_SEEN = await asyncio.to_thread(_load_first_seen)
+    MIRROR = await asyncio.to_thread(_mirror_load)
+    # Compact the append-only stores once per boot (also migrates legacy whole-JSON files)
+    await asyncio.to_thread(_save_first_seen, FIRST_SEEN)
+    await asyncio.to_thread(_mirror_save, MIRROR)
+    await asyncio.to_thread(twitter_scraper._save_cache)
+    MY_HANDLES = await asyncio.to_thread(load_my_following)
+    TWITTER_BLACKLIST = await asyncio.to_thread(load_twitter_blacklist)
     
     # ========== BUY BOT STARTUP ==========
     if BUY_BOT_ENABLED:
@@ -1963,6 +2609,11 @@ async def _startup():
             log.error("Trading will be disabled. Check wallet private key and RPC settings.")
     # ========== END BUY BOT STARTUP ==========
     
+    # Warm DNS/TLS and the JSON cache so the first ingester tick isn't a cold fetch
+    task = asyncio.create_task(_discover_profiles_latest(CHAIN_ID))
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(BACKGROUND_TASKS.discard)
+    
     asyncio.create_task(_start_bot_and_jobs())
 
 async def check_user_balances(context: ContextTypes.DEFAULT_TYPE):
@@ -2016,10 +2667,16 @@ async def check_user_balances(context: ContextTypes.DEFAULT_TYPE):
 async def _start_bot_and_jobs():
     try:
         await application.initialize()
+        # post_init (_post_init) only runs under run_polling/run_webhook, not initialize()/start()
+        await _validate_subs(application.bot)
         jq = application.job_queue
-        jq.run_repeating(ingester, interval=timedelta(seconds=INGEST_INTERVAL_SEC), first=timedelta(seconds=2), name="ingester")
-        jq.run_repeating(auto_trade, interval=timedelta(seconds=TRADE_SUMMARY_SEC), first=timedelta(seconds=3), name="trade_tick")
-        jq.run_repeating(updater, interval=timedelta(seconds=UPDATE_INTERVAL_SEC), first=timedelta(seconds=20), name="updates")
+        # APScheduler already runs one instance per job and coalesces missed runs; lifting the 1s default
+        # misfire grace means a tick delayed by a busy loop still runs late instead of being dropped
+        tick = {"misfire_grace_time": None}
+        jq.run_repeating(ingester, interval=timedelta(seconds=INGEST_INTERVAL_SEC), first=timedelta(seconds=2), name="ingester", job_kwargs=tick)
+        jq.run_repeating(auto_trade, interval=timedelta(seconds=TRADE_SUMMARY_SEC), first=timedelta(seconds=3), name="trade_tick", job_kwargs=tick)
+        jq.run_repeating(updater, interval=timedelta(seconds=UPDATE_INTERVAL_SEC), first=timedelta(seconds=20), name="updates", job_kwargs=tick)
+        jq.run_repeating(prune_state, interval=timedelta(minutes=10), first=timedelta(minutes=1), name="prune", job_kwargs=tick)
         
         # Multi-user balance checker
         if MULTIUSER_ENABLED:
@@ -2037,14 +2694,30 @@ async def _shutdown():
         await application.stop()
     finally:
         await application.shutdown()
+        await flush_subs()
+        await _close_http()
+
+WEBHOOK_MAX_BODY = 1024*1024  # Telegram updates are a few KB
 
 @app.post("/webhook/{token}")
 async def telegram_webhook(token: str, request: Request):
     if token != TG:
         return Response(status_code=403)
+    # Reject non-JSON and empty/oversized posts from headers alone, before reading or parsing a body
+    if request.headers.get("content-type", "").split(";")[0].strip() != "application/json":
+        return Response(status_code=415)
+    try: size = int(request.headers.get("content-length") or -1)
+    except ValueError: size = -1
+    if size == 0 or size > WEBHOOK_MAX_BODY:
+        return Response(status_code=400)
+    body = await request.body()
+    if not body or len(body) > WEBHOOK_MAX_BODY:
+        return Response(status_code=400)
     try:
-        data: Dict[str, Any] = await request.json()
-    except:
+        data: Dict[str, Any] = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return Response(status_code=400)
+    if not isinstance(data, dict):
         return Response(status_code=400)
     try:
         update = Update.de_json(data, application.bot)
@@ -2055,5 +2728,12 @@ async def telegram_webhook(token: str, request: Request):
 
 if __name__ == "__main__":
     import uvicorn
+    try:
+        import uvloop  # noqa: F401  libuv-backed loop; not available on Windows
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
     port = int(os.environ.get("PORT", "8080"))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=False)
+    # Let uvicorn set the loop up itself (a pre-installed policy can be overridden by its own setup);
+    # http="auto" already picks httptools, which uvicorn[standard] installs
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=False, loop=loop)
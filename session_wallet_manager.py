@@ -3,7 +3,7 @@ Session Wallet Manager - Multi-User Trading Bot
 Creates and manages isolated session wallets for each user
 """
 
-import json
+import orjson
 import os
 import logging
 from typing import Dict, Optional, Any
@@ -30,10 +30,9 @@ class SessionWalletManager:
         """Load user data from disk"""
         if USERS_DB_FILE.exists():
             try:
-                with open(USERS_DB_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Convert string keys back to int
-                    self.users = {int(k): v for k, v in data.items()}
+                data = orjson.loads(USERS_DB_FILE.read_bytes())
+                # Convert string keys back to int
+                self.users = {int(k): v for k, v in data.items()}
                 log.info(f"Loaded {len(self.users)} users from database")
             except Exception as e:
                 log.error(f"Failed to load users: {e}")
@@ -46,8 +45,7 @@ class SessionWalletManager:
         try:
             # Convert int keys to string for JSON
             data = {str(k): v for k, v in self.users.items()}
-            with open(USERS_DB_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            USERS_DB_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             log.info(f"Saved {len(self.users)} users to database")
         except Exception as e:
             log.error(f"Failed to save users: {e}")